@@ -21,7 +21,7 @@ import logging
 import asyncio
 from datetime import datetime, timedelta
 from utils.timezone import IST
-from utils.database import get_guild_config
+from utils.database import get_guild_config, create_default_guild_config
 
 logger = logging.getLogger(__name__)
 
@@ -324,14 +324,8 @@ def create_bot():
                 config = await get_guild_config(bot.guild_configs, str(guild.id))
                 if not config:
                     # Create default config for new guilds
-                    await bot.guild_configs.insert_one({
-                        "guild_id": str(guild.id),
-                        "guild_name": guild.name,
-                        "welcome_channel_id": None,
-                        "announcement_channel_id": None,
-                        "birthday_message": "🎉 **Happy Birthday {USER_MENTION}!** 🎉\nHope you have an amazing day!"
-                    })
-                    logger.info(f"✅ Initialized config for {guild.name}")
+                    if await create_default_guild_config(bot.guild_configs, guild):
+                        logger.info(f"✅ Initialized config for {guild.name}")
             except Exception as e:
                 logger.error(f"❌ Error initializing config for {guild.name}: {str(e)}")
         
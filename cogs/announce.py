@@ -75,14 +75,14 @@ class AnnounceCog(commands.Cog):
             # ============================================================================
             
             # Get guild configuration for announcement channel
-            config = await get_guild_config(self.bot.guild_configs, str(ctx.guild.id))
+            config = await get_guild_config(self.bot.guild_configs, str(ctx.guild.id), ("announcement_channel_id",))
             announcement_channel_id = config.get('announcement_channel_id') if config else None
             
             if not announcement_channel_id:
                 await ctx.send("❌ Announcement channel not configured! Set it with `/config announcement #channel`", ephemeral=True)
                 return
             
-            announcement_channel = self.bot.get_channel(int(announcement_channel_id))
+            announcement_channel = self.bot.get_channel(announcement_channel_id)
             if not announcement_channel:
                 await ctx.send("❌ Announcement channel not found! It might have been deleted.", ephemeral=True)
                 return
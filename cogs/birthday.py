@@ -15,13 +15,73 @@ The cog provides both user commands (for setting own birthday) and admin command
 
 import discord
 from discord.ext import commands
+from pymongo import ReturnDocument
+from pymongo.errors import OperationFailure
 from datetime import datetime
 from utils.timezone import IST
 from utils.database import get_guild_config
+import asyncio
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
+# Placeholders supported in birthday messages, substituted in a single pass
+_PLACEHOLDER_PATTERN = re.compile(r"\{(USER_MENTION|USER_NAME)\}")
+
+def _render_message(template, member):
+    """
+    Fill in the birthday message placeholders for a member
+    
+    Replaces {USER_MENTION} and {USER_NAME} in one scan of the template.
+    Any other text, including unrelated braces, is left untouched.
+    
+    Args:
+        template: The birthday message containing placeholders
+        member: The Discord member being celebrated
+        
+    Returns:
+        str: The message with placeholders substituted
+    """
+    values = {"USER_MENTION": member.mention, "USER_NAME": member.display_name}
+    return _PLACEHOLDER_PATTERN.sub(lambda match: values[match.group(1)], template)
+
+# Maximum number of birthday announcements sent to Discord at the same time
+BIRTHDAY_SEND_CONCURRENCY = 25
+
+# Discord embed limits used when paging the birthday list
+EMBED_MAX_FIELDS = 25     # Discord allows at most 25 fields per embed
+EMBED_MAX_CHARS = 5500    # Stay under Discord's 6000 character total per embed
+EMBED_FIELD_MAX_VALUE = 1024
+
+# Days per month for MM-DD validation (February allows 29 for leap-day birthdays)
+_DAYS_IN_MONTH = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+def _parse_birthday(date):
+    """
+    Validate an MM-DD date string and return it zero-padded
+    
+    Uses plain integer bounds checks instead of building a datetime.
+    
+    Args:
+        date: The date string supplied by the user (e.g. "5-15" or "05-15")
+        
+    Returns:
+        str: The normalized birthday in MM-DD format
+        
+    Raises:
+        ValueError: If the string is not a valid month and day
+    """
+    parts = date.split('-')
+    if len(parts) != 2 or not parts[0].isdigit() or not parts[1].isdigit():
+        raise ValueError(f"Invalid date format: {date}")
+    
+    month, day = int(parts[0]), int(parts[1])
+    if not (1 <= month <= 12 and 1 <= day <= _DAYS_IN_MONTH[month]):
+        raise ValueError(f"Invalid date: {date}")
+    
+    return f"{month:02d}-{day:02d}"
+
 class BirthdayCog(commands.Cog):
     """
     Birthday management cog that handles all birthday-related functionality
@@ -41,8 +101,37 @@ class BirthdayCog(commands.Cog):
             bot: The Discord bot instance
         """
         self.bot = bot
+        self._send_semaphore = asyncio.Semaphore(BIRTHDAY_SEND_CONCURRENCY)
         logger.info("Birthday cog initialized")
     
+    async def cog_load(self):
+        """
+        Ensure the birthday indexes exist when the cog is loaded
+        
+        Commands look records up by (guild_id, user_id) and the midnight task
+        filters by birthday, so both get an index instead of a collection scan.
+        The compound index is unique so a user can only have one birthday per guild.
+        
+        cog_load runs inside add_cog before any command is registered, so the
+        unique guarantee is in place before the first /birthday can race.
+        """
+        # The daily announcement query filters on this index, so it is created
+        # on its own and can't be held back by a failure on the unique index
+        try:
+            await self.bot.birthdays.create_index([("birthday", 1)])
+        except Exception as e:
+            logger.warning(f"Could not create birthday date index: {str(e)}")
+        
+        try:
+            await self.bot.birthdays.create_index([("guild_id", 1), ("user_id", 1)], unique=True)
+            logger.info("Birthday indexes ensured")
+        except OperationFailure as e:
+            # Usually existing duplicate (guild_id, user_id) records; the index
+            # can only be built once they are removed
+            logger.error(f"Could not enforce unique birthdays per user (remove duplicate records): {str(e)}")
+        except Exception as e:
+            logger.warning(f"Could not create birthday indexes: {str(e)}")
+    
     @commands.Cog.listener()
     async def on_ready(self):
         """Called when the cog is ready and loaded"""
@@ -58,9 +147,10 @@ class BirthdayCog(commands.Cog):
         
         This method:
         1. Checks the current date in IST timezone
-        2. Queries the database for all birthdays on today's date
+        2. Queries the database for all birthdays on today's date, joined
+           with each guild's configuration in one aggregation
         3. Groups birthdays by guild (server)
-        4. Sends personalized birthday announcements to each guild
+        4. Sends personalized birthday announcements to each guild concurrently
         5. Handles custom messages and default messages
         6. Includes user avatars and personalized content
         
@@ -74,9 +164,37 @@ class BirthdayCog(commands.Cog):
             
             logger.info(f"Checking for birthdays on {today_str}")
             
-            # Query database for all birthdays on today's date
-            cursor = self.bot.birthdays.find({"birthday": today_str})
-            birthdays = await cursor.to_list(length=None)
+            # Index-only probe so days without birthdays never open a cursor
+            if not await self.bot.birthdays.count_documents({"birthday": today_str}, limit=1):
+                logger.info("No birthdays today")
+                return
+            
+            # Fetch today's birthdays joined with their guild configuration in
+            # a single aggregation. Birthdays store guild_id as an int while
+            # guild_configs store it as a string, so the join key is converted
+            # on the server first; an equality (localField/foreignField) join
+            # uses the unique guild_configs.guild_id index on every MongoDB
+            # version. The leading $match is served by the birthday index
+            # created in cog_load (no hint, so a missing index only makes the
+            # query slower instead of failing it).
+            pipeline = [
+                {"$match": {"birthday": today_str}},
+                {"$addFields": {"gid": {"$toString": "$guild_id"}}},
+                {"$lookup": {
+                    "from": "guild_configs",
+                    "localField": "gid",
+                    "foreignField": "guild_id",
+                    "as": "cfg",
+                }},
+                # Keep birthdays of guilds without a config so they are still reported
+                {"$unwind": {"path": "$cfg", "preserveNullAndEmptyArrays": True}},
+                # Only the config fields the announcement needs are returned
+                {"$project": {
+                    "user_id": 1, "guild_id": 1, "custom_message": 1, "_id": 0,
+                    "cfg.birthday_channel_id": 1, "cfg.announcement_channel_id": 1, "cfg.birthday_message": 1,
+                }},
+            ]
+            birthdays = await self.bot.birthdays.aggregate(pipeline).to_list(length=None)
             
             if not birthdays:
                 logger.info("No birthdays today")
@@ -84,17 +202,22 @@ class BirthdayCog(commands.Cog):
             
             logger.info(f"Found {len(birthdays)} birthdays today")
             
-            # Group birthdays by guild (server) for efficient processing
+            # Group birthdays by guild (server), keeping each guild's joined config
             guild_birthdays = {}
+            configs = {}
             for birthday_doc in birthdays:
                 guild_id = birthday_doc.get('guild_id')
                 # Convert to string for consistent comparison
                 guild_id_str = str(guild_id)
                 if guild_id_str not in guild_birthdays:
                     guild_birthdays[guild_id_str] = []
+                    if birthday_doc.get('cfg'):
+                        configs[guild_id_str] = birthday_doc['cfg']
                 guild_birthdays[guild_id_str].append(birthday_doc)
             
-            # Send announcements for each guild
+            # Build announcements for each guild; the sends are collected and
+            # dispatched together once every guild has been processed
+            sends = []
             for guild_id_str, guild_birthday_list in guild_birthdays.items():
                 try:
                     # Convert back to int for get_guild
@@ -104,14 +227,13 @@ class BirthdayCog(commands.Cog):
                         continue
                     
                     # Get guild configuration for birthday settings
-                    config = await get_guild_config(self.bot.guild_configs, str(guild_id))
-                    # Try birthday_channel_id first, fallback to announcement_channel_id for backward compatibility
-                    birthday_channel_id = config.get('birthday_channel_id') if config else None
-                    if not birthday_channel_id:
-                        birthday_channel_id = config.get('announcement_channel_id') if config else None
-                    
+                    config = configs.get(guild_id_str) or {}
                     default_message = config.get('birthday_message', "🎉 **Happy Birthday {USER_MENTION}!** 🎉\nHope you have an amazing day!")
                     
+                    # Resolve the guild's birthday channel once (inside this guild's
+                    # try, so a malformed stored id only skips this guild)
+                    # Try birthday_channel_id first, fallback to announcement_channel_id for backward compatibility
+                    birthday_channel_id = config.get('birthday_channel_id') or config.get('announcement_channel_id')
                     if not birthday_channel_id:
                         logger.warning(f"No birthday channel configured for guild {guild_id}")
                         continue
@@ -142,9 +264,9 @@ class BirthdayCog(commands.Cog):
                         
                         # Use custom message if available, otherwise use default
                         if custom_message:
-                            message = custom_message.replace('{USER_MENTION}', member.mention).replace('{USER_NAME}', member.display_name)
+                            message = _render_message(custom_message, member)
                         else:
-                            message = default_message.replace('{USER_MENTION}', member.mention).replace('{USER_NAME}', member.display_name)
+                            message = _render_message(default_message, member)
                         
                         # Create embed with profile picture and custom text
                         embed = discord.Embed(
@@ -155,16 +277,35 @@ class BirthdayCog(commands.Cog):
                         embed.set_thumbnail(url=member.avatar.url if member.avatar else member.default_avatar.url)
                         embed.set_footer(text=f"🎈 {member.display_name} is celebrating today!")
                         
-                        # Send birthday announcement
-                        await birthday_channel.send(embed=embed)
-                        logger.info(f"Sent birthday announcement for {member.display_name} in {guild.name}")
+                        # Queue birthday announcement
+                        sends.append(self._send_announcement(birthday_channel, embed, member, guild))
                     
                 except Exception as e:
                     logger.error(f"Error sending birthday announcements for guild {guild_id}: {str(e)}")
+            
+            # Send all announcements concurrently (bounded by the send semaphore)
+            results = await asyncio.gather(*sends, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Error sending birthday announcement: {str(result)}")
                     
         except Exception as e:
             logger.error(f"Error checking today's birthdays: {str(e)}")
     
+    async def _send_announcement(self, channel, embed, member, guild):
+        """
+        Send a single birthday announcement, limited by the send semaphore
+        
+        Args:
+            channel: The channel to post the announcement in
+            embed: The birthday embed to send
+            member: The member being celebrated
+            guild: The guild the announcement belongs to
+        """
+        async with self._send_semaphore:
+            await channel.send(embed=embed)
+        logger.info(f"Sent birthday announcement for {member.display_name} in {guild.name}")
+    
     # ============================================================================
     # BIRTHDAY COMMANDS SECTION
     # ============================================================================
@@ -185,6 +326,8 @@ class BirthdayCog(commands.Cog):
             custom_message: Optional custom birthday message
         """
         try:
+            guild_id = ctx.guild.id
+            
             # Check if user is admin
             is_admin = ctx.author.guild_permissions.administrator
             
@@ -199,33 +342,37 @@ class BirthdayCog(commands.Cog):
                     return
                 
                 member = ctx.message.mentions[0]
+                birthday_filter = {"user_id": member.id, "guild_id": guild_id}
                 date = user_or_date
                 
                 # Validate date format (MM-DD)
                 try:
-                    month, day = map(int, date.split('-'))
-                    datetime.now(IST).replace(year=2020, month=month, day=day)
-                    birthday = f"{month:02d}-{day:02d}"
+                    birthday = _parse_birthday(date)
                 except (ValueError, AttributeError):
                     await ctx.send("❌ Invalid date format. Use MM-DD (e.g., 12-31)", ephemeral=True)
                     return
                 
-                # Check if birthday already exists for this user
-                existing = await self.bot.birthdays.find_one({"user_id": member.id, "guild_id": ctx.guild.id})
-                if existing:
-                    await ctx.send(f"❌ Birthday for {member.mention} is already set to {existing.get('birthday')}!", ephemeral=True)
-                    return
-                
-                # Save birthday to database
-                await self.bot.birthdays.update_one(
-                    {"user_id": member.id, "guild_id": ctx.guild.id},
-                    {"$set": {"birthday": birthday, "custom_message": custom_message}},
-                    upsert=True
+                # Save birthday only if this user doesn't have one yet. The
+                # pipeline update keeps existing values and returns the prior
+                # document, so the reject reply needs no second query.
+                has_birthday = {"$ifNull": ["$birthday", False]}
+                prior = await self.bot.birthdays.find_one_and_update(
+                    birthday_filter,
+                    [{"$set": {
+                        "birthday": {"$cond": [has_birthday, "$birthday", {"$literal": birthday}]},
+                        "custom_message": {"$cond": [has_birthday, "$custom_message", {"$literal": custom_message}]},
+                    }}],
+                    projection={"birthday": 1, "_id": 0},
+                    upsert=True,
+                    return_document=ReturnDocument.BEFORE
                 )
+                if prior and prior.get('birthday'):
+                    await ctx.send(f"❌ Birthday for {member.mention} is already set to {prior['birthday']}!", ephemeral=True)
+                    return
                 
                 # Send confirmation with preview if custom message provided
                 if custom_message:
-                    preview = custom_message.replace('{USER_MENTION}', member.mention).replace('{USER_NAME}', member.display_name)
+                    preview = _render_message(custom_message, member)
                     await ctx.send(f"🎂 Birthday for {member.mention} set to {date} with custom message!\n\n**Preview:**\n{preview}")
                 else:
                     await ctx.send(f"🎂 Birthday for {member.mention} set to {date}!")
@@ -236,29 +383,28 @@ class BirthdayCog(commands.Cog):
                 # ============================================================================
                 
                 # User format: !birthday MM-DD
+                birthday_filter = {"user_id": ctx.author.id, "guild_id": guild_id}
                 date = user_or_date
                 
                 # Validate date format (MM-DD)
                 try:
-                    month, day = map(int, date.split('-'))
-                    datetime.now(IST).replace(year=2020, month=month, day=day)
-                    birthday = f"{month:02d}-{day:02d}"
+                    birthday = _parse_birthday(date)
                 except (ValueError, AttributeError):
                     await ctx.send("❌ Invalid date format. Use MM-DD (e.g., 12-31)", ephemeral=True)
                     return
                 
-                # Check if user's birthday already exists
-                existing = await self.bot.birthdays.find_one({"user_id": ctx.author.id, "guild_id": ctx.guild.id})
-                if existing:
-                    await ctx.send(f"❌ Your birthday is already set to {existing.get('birthday')}! Contact an admin to change it.", ephemeral=True)
-                    return
-                
-                # Save user's own birthday to database
-                await self.bot.birthdays.update_one(
-                    {"user_id": ctx.author.id, "guild_id": ctx.guild.id},
-                    {"$set": {"birthday": birthday}},
-                    upsert=True
+                # Save user's own birthday only if it isn't set yet, getting
+                # the prior document back in the same round-trip
+                prior = await self.bot.birthdays.find_one_and_update(
+                    birthday_filter,
+                    [{"$set": {"birthday": {"$ifNull": ["$birthday", {"$literal": birthday}]}}}],
+                    projection={"birthday": 1, "_id": 0},
+                    upsert=True,
+                    return_document=ReturnDocument.BEFORE
                 )
+                if prior and prior.get('birthday'):
+                    await ctx.send(f"❌ Your birthday is already set to {prior['birthday']}! Contact an admin to change it.", ephemeral=True)
+                    return
                 
                 await ctx.send(f"🎂 Your birthday has been set to {date}! You'll receive birthday announcements on this date.", ephemeral=True)
                 
@@ -302,48 +448,63 @@ class BirthdayCog(commands.Cog):
         List all birthdays in the server (Admin only)
         
         This command shows all configured birthdays with user names,
-        dates, and custom messages in an organized embed.
+        dates, and custom messages. Large lists are split across several
+        embeds so Discord's per-embed field and size limits are respected.
         """
+        guild_id = ctx.guild.id
         try:
             # Query all birthdays for this guild
-            cursor = self.bot.birthdays.find({"guild_id": ctx.guild.id})
+            cursor = self.bot.birthdays.find({"guild_id": guild_id})
             birthdays = await cursor.to_list(length=None)
             
             if not birthdays:
                 await ctx.send("📋 No birthdays set in this server.", ephemeral=True)
                 return
             
-            # Create embed to display birthdays
-            embed = discord.Embed(
-                title="🎂 Server Birthdays",
-                description=f"Found {len(birthdays)} birthday(s):",
-                color=discord.Color.pink()
-            )
+            # Build one or more embeds, starting a new page whenever the
+            # current one would exceed Discord's field or size limits
+            get_member = ctx.guild.get_member
+            pages = []
+            embed = None
             
-            # Add each birthday to the embed
             for birthday_doc in birthdays:
                 user_id = birthday_doc.get('user_id')
                 birthday = birthday_doc.get('birthday')
                 custom_message = birthday_doc.get('custom_message', 'No custom message')
                 
                 # Get user information
-                user = ctx.guild.get_member(user_id)
+                user = get_member(user_id)
                 user_name = user.display_name if user else f"User {user_id}"
                 
-                embed.add_field(
-                    name=f"🎈 {user_name}",
-                    value=f"**Date**: {birthday}\n**Custom Message**: {custom_message}",
-                    inline=False
-                )
+                field_name = f"🎈 {user_name}"
+                field_value = f"**Date**: {birthday}\n**Custom Message**: {custom_message}"[:EMBED_FIELD_MAX_VALUE]
+                
+                if (embed is None
+                        or len(embed.fields) >= EMBED_MAX_FIELDS
+                        or len(embed) + len(field_name) + len(field_value) > EMBED_MAX_CHARS):
+                    embed = discord.Embed(
+                        title="🎂 Server Birthdays",
+                        description=f"Found {len(birthdays)} birthday(s):",
+                        color=discord.Color.pink()
+                    )
+                    pages.append(embed)
+                
+                embed.add_field(name=field_name, value=field_value, inline=False)
+            
+            # Number the pages when the list didn't fit in a single embed
+            if len(pages) > 1:
+                for page_number, page in enumerate(pages, start=1):
+                    page.set_footer(text=f"Page {page_number}/{len(pages)}")
             
-            await ctx.send(embed=embed, ephemeral=True)
+            for page in pages:
+                await ctx.send(embed=page, ephemeral=True)
             
         except Exception as e:
             # Handle database connection errors gracefully
             error_msg = str(e)
             if "Cannot use MongoClient after close" in error_msg:
                 await ctx.send("❌ Database connection temporarily unavailable. Please try again in a moment.", ephemeral=True)
-                logger.error(f"MongoDB connection closed while listing birthdays for guild {ctx.guild.id}. This may be due to a temporary disconnect.")
+                logger.error(f"MongoDB connection closed while listing birthdays for guild {guild_id}. This may be due to a temporary disconnect.")
             else:
                 await ctx.send(f"❌ Error: {error_msg}", ephemeral=True)
                 logger.error(f"Error listing birthdays: {error_msg}")
@@ -370,9 +531,13 @@ class BirthdayCog(commands.Cog):
         try:
             if member is None:
                 member = ctx.author
+            guild_id = ctx.guild.id
             
             # Get guild configuration for birthday settings
-            config = await get_guild_config(self.bot.guild_configs, str(ctx.guild.id))
+            config = await get_guild_config(
+                self.bot.guild_configs, str(guild_id),
+                ("birthday_channel_id", "announcement_channel_id", "birthday_message")
+            )
             
             # Get birthday channel (try birthday_channel_id first, fallback to announcement_channel_id)
             birthday_channel_id = config.get('birthday_channel_id') if config else None
@@ -383,22 +548,22 @@ class BirthdayCog(commands.Cog):
                 await ctx.send("❌ Birthday channel not configured! Set it with `/config birthday #channel`", ephemeral=True)
                 return
             
-            birthday_channel = self.bot.get_channel(int(birthday_channel_id))
+            birthday_channel = self.bot.get_channel(birthday_channel_id)
             if not birthday_channel:
                 await ctx.send("❌ Birthday channel not found! It might have been deleted.", ephemeral=True)
                 return
             
             # Get user's custom message if available
-            birthday_doc = await self.bot.birthdays.find_one({"user_id": member.id, "guild_id": ctx.guild.id})
+            birthday_doc = await self.bot.birthdays.find_one({"user_id": member.id, "guild_id": guild_id})
             custom_message = birthday_doc.get('custom_message') if birthday_doc else None
             default_message = config.get('birthday_message', "🎉 **Happy Birthday {USER_MENTION}!** 🎉\nThis is a test birthday announcement!")
             
             # Use custom message if available, otherwise use default
             if custom_message:
-                message = custom_message.replace('{USER_MENTION}', member.mention).replace('{USER_NAME}', member.display_name)
+                message = _render_message(custom_message, member)
                 message += "\n\n*(This is a test with custom message)*"
             else:
-                message = default_message.replace('{USER_MENTION}', member.mention).replace('{USER_NAME}', member.display_name)
+                message = _render_message(default_message, member)
                 message += "\n\n*(This is a test with default message)*"
             
             # Send test birthday announcement to announcement channel
@@ -15,13 +15,127 @@ to help server admins set up their bot properly.
 
 import discord
 from discord.ext import commands
+from pymongo.errors import OperationFailure
+import itertools
 import logging
-from utils.database import get_guild_config
+import time
+from utils.database import get_guild_config, update_guild_config, create_default_guild_config
 from utils.timezone import IST
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# ============================================================================
+# PERMISSION CHECK SECTION
+# ============================================================================
+
+ADMIN_CHECK_TTL = 5  # Seconds an administrator check result is reused
+_admin_cache = {}    # (guild_id, user_id) -> (checked_at, is_admin)
+
+def is_admin_cached():
+    """
+    Command check requiring administrator permissions, memoized briefly
+    
+    Works like @commands.has_permissions(administrator=True) and raises the
+    same MissingPermissions error, but remembers the result per (guild, user)
+    for ADMIN_CHECK_TTL seconds so admins running several config commands in
+    a row don't re-resolve their permissions every time. The TTL is short
+    enough that a revoked admin role takes effect within seconds.
+    """
+    async def predicate(ctx):
+        if ctx.guild is None:
+            raise commands.NoPrivateMessage()
+        
+        key = (ctx.guild.id, ctx.author.id)
+        now = time.monotonic()
+        cached = _admin_cache.get(key)
+        if cached and now - cached[0] < ADMIN_CHECK_TTL:
+            is_admin = cached[1]
+        else:
+            is_admin = ctx.author.guild_permissions.administrator
+            if len(_admin_cache) >= 1024:
+                _admin_cache.clear()  # Entries are short-lived; just start over
+            _admin_cache[key] = (now, is_admin)
+        
+        if not is_admin:
+            raise commands.MissingPermissions(["administrator"])
+        return True
+    return commands.check(predicate)
+
+# Channel types accepted by /config (stored as <type>_channel_id)
+_VALID_CONFIG_TYPES = frozenset({"welcome", "log", "announcement", "birthday", "events"})
+_VALID_CONFIG_TYPES_MSG = ", ".join(sorted(_VALID_CONFIG_TYPES))
+
+# ============================================================================
+# BOT INTRODUCTION CONTENT SECTION
+# ============================================================================
+
+# Feature fields shown by /botintro as (name, value, inline) triples.
+# The content is static, so it is built once at import time; each field's
+# bullet list is kept one bullet per line and joined here.
+_BOTINTRO_FIELDS = (
+    # Birthday celebrations feature
+    ("🎂 Birthday Celebrations",
+     "\n".join((
+         "• Automatic celebrations at midnight",
+         "• Custom birthday messages",
+         "• Beautiful announcements with avatars",
+     )),
+     True),
+    # Daily events feature
+    ("📅 Daily Events",
+     "\n".join((
+         "• Morning updates at 8 AM",
+         "• Holiday reminders",
+         "• Special observances",
+     )),
+     True),
+    # Welcome system feature
+    ("🌟 Welcome System",
+     "\n".join((
+         "• Warm welcomes for new members",
+         "• Beautiful welcome cards",
+         "• Rotating welcome messages",
+     )),
+     True),
+    # Management tools feature
+    ("⚙️ Easy Management",
+     "\n".join((
+         "• Simple `/config` commands",
+         "• Web dashboard for configuration",
+         "• Admin testing tools",
+     )),
+     True),
+)
+
+# Static part of the /botintro embed in Discord's embed dict format; each call
+# builds its embed with Embed.from_dict and only adds timestamp and footer.
+# from_dict keeps a reference to the "fields" list, so callers pass a copy
+# of the fields to keep this constant unchanged.
+_BOTINTRO_EMBED = {
+    "title": "🤖 Server Manager Bot",
+    "description": "Hi everyone! 👋 I'm here to help manage this server and make it awesome! Here's what I can do:",
+    "color": 0x9B59B6,  # discord.Color.purple()
+    "fields": [{"name": name, "value": value, "inline": inline} for name, value, inline in _BOTINTRO_FIELDS],
+}
+
+# ============================================================================
+# WELCOME MESSAGES SECTION
+# ============================================================================
+
+# Different welcome messages that rotate
+# This provides variety in welcome messages to make them feel more personal
+_WELCOME_MESSAGES = (
+    "We're delighted to have you join our community! Your presence here is truly valued. Welcome aboard, and we hope you have an amazing time with us! 🌟",
+    "Welcome to our wonderful community! We're so excited to have you here. Your journey with us begins now, and we can't wait to see what you'll bring to our server! ✨",
+    "A warm welcome to our newest member! You've just joined an amazing community filled with wonderful people. We're thrilled to have you here! 🎉",
+    "Welcome aboard! You've found your way to our special community, and we're absolutely delighted to have you here. Let's make some amazing memories together! 🌈",
+    "Hello and welcome! You've just joined a fantastic community where everyone is valued and appreciated. We're so glad you're here! 🎊",
+    "Welcome to our family! You've just become part of something truly special. We're excited to get to know you and share this amazing journey together! 💫",
+    "A heartfelt welcome to our newest member! You've joined a community that values friendship, respect, and fun. We're so happy you're here! 🌟",
+    "Welcome to our wonderful server! You've just stepped into a community filled with amazing people and great vibes. We're excited to have you here! ✨",
+)
+
 class ConfigCog(commands.Cog):
     """
     Configuration management cog that handles server setup and welcome messages
@@ -42,37 +156,69 @@ class ConfigCog(commands.Cog):
             bot: The Discord bot instance
         """
         self.bot = bot
-        logger.info("Config cog initialized")
         
         # ============================================================================
         # WELCOME MESSAGE SYSTEM SECTION
         # ============================================================================
         
-        # Array of different welcome messages that rotate
-        # This provides variety in welcome messages to make them feel more personal
-        self.welcome_messages = [
-            "We're delighted to have you join our community! Your presence here is truly valued. Welcome aboard, and we hope you have an amazing time with us! 🌟",
-            "Welcome to our wonderful community! We're so excited to have you here. Your journey with us begins now, and we can't wait to see what you'll bring to our server! ✨",
-            "A warm welcome to our newest member! You've just joined an amazing community filled with wonderful people. We're thrilled to have you here! 🎉",
-            "Welcome aboard! You've found your way to our special community, and we're absolutely delighted to have you here. Let's make some amazing memories together! 🌈",
-            "Hello and welcome! You've just joined a fantastic community where everyone is valued and appreciated. We're so glad you're here! 🎊",
-            "Welcome to our family! You've just become part of something truly special. We're excited to get to know you and share this amazing journey together! 💫",
-            "A heartfelt welcome to our newest member! You've joined a community that values friendship, respect, and fun. We're so happy you're here! 🌟",
-            "Welcome to our wonderful server! You've just stepped into a community filled with amazing people and great vibes. We're excited to have you here! ✨"
-        ]
-        self.current_welcome_index = 0  # Track which message to use next
+        # Rotating welcome messages (shared, immutable module-level tuple)
+        self.welcome_messages = _WELCOME_MESSAGES
+        self._welcome_cycle = itertools.cycle(self.welcome_messages)  # Yields the next message in rotation
+        
+        # Static part of the test welcome embed; test_welcome copies it and
+        # fills in the member and server specific fields
+        self._welcome_template = discord.Embed(
+            description="We're delighted to have you join our wonderful community! Your presence here is truly valued and we're excited to have you as part of our server family.",
+            color=discord.Color.gold()
+        )
+        
+        # Bot introduction footer, filled in on first /botintro once bot.user is set
+        self._botintro_footer_text = None
+        self._botintro_footer_icon = None
+    
+    async def cog_load(self):
+        """
+        Ensure the guild config index exists when the cog is loaded
+        
+        Every config read and upsert filters on guild_id, so a unique index
+        turns those into index lookups instead of collection scans and keeps
+        each guild down to a single config document. cog_load runs once per
+        process when the cog is added, and create_index is a no-op if the
+        index already exists.
+        """
+        try:
+            await self.bot.guild_configs.create_index("guild_id", unique=True)
+            logger.info("Guild config index ensured")
+        except OperationFailure as e:
+            # Usually existing duplicate guild_id records; the index can only
+            # be built once they are removed
+            logger.error(f"Could not enforce unique guild configs (remove duplicate records): {str(e)}")
+        except Exception as e:
+            logger.warning(f"Could not create guild config index: {str(e)}")
     
     @commands.Cog.listener()
-    async def on_ready(self):
-        """Called when the cog is ready and loaded"""
-        logger.info("Config cog ready")
+    async def on_guild_join(self, guild):
+        """
+        Create the default configuration when the bot joins a new guild
+        
+        With the document in place up front, configuration changes are plain
+        updates rather than upserts.
+        
+        Args:
+            guild: The guild the bot joined
+        """
+        try:
+            if await create_default_guild_config(self.bot.guild_configs, guild):
+                logger.info(f"✅ Initialized config for {guild.name}")
+        except Exception as e:
+            logger.error(f"❌ Error initializing config for {guild.name}: {str(e)}")
     
     # ============================================================================
     # CONFIGURATION COMMANDS SECTION
     # ============================================================================
     
     @commands.hybrid_command(name="config", description="Set channel configurations (Admin only)")
-    @commands.has_permissions(administrator=True)
+    @is_admin_cached()
     async def config_command(self, ctx, config_type: str, channel: discord.TextChannel):
         """
         Set channel configuration for the server (Admin only)
@@ -87,21 +233,23 @@ class ConfigCog(commands.Cog):
             config_type: Type of configuration (welcome, log, announcement)
             channel: The Discord channel to use for this configuration
         """
-        # Define valid configuration types
-        valid_types = ['welcome', 'log', 'announcement', 'birthday', 'events']
-        
-        # Validate the configuration type
-        if config_type.lower() not in valid_types:
-            await ctx.send(f"❌ Invalid config type. Valid types: {', '.join(valid_types)}", ephemeral=True)
+        # Validate the configuration type (lowercased once and reused below)
+        config_type = config_type.lower()
+        if config_type not in _VALID_CONFIG_TYPES:
+            await ctx.send(f"❌ Invalid config type. Valid types: {_VALID_CONFIG_TYPES_MSG}", ephemeral=True)
             return
         
         try:
-            # Update database with new configuration
-            await self.bot.guild_configs.update_one(
-                {"guild_id": str(ctx.guild.id)},
-                {"$set": {f"{config_type}_channel_id": str(channel.id)}},
-                upsert=True  # Create new config if it doesn't exist
+            # Update database with new configuration (creates the config if it
+            # doesn't exist and drops the cached copy used by test_welcome/botintro)
+            updated = await update_guild_config(
+                self.bot.guild_configs,
+                str(ctx.guild.id),
+                {f"{config_type}_channel_id": channel.id}
             )
+            if not updated:
+                await ctx.send("❌ Error: Failed to save configuration. Please try again.", ephemeral=True)
+                return
             
             # Send confirmation message
             await ctx.send(f"✅ {config_type.title()} channel set to {channel.mention}!", ephemeral=True)
@@ -116,7 +264,7 @@ class ConfigCog(commands.Cog):
     # ============================================================================
     
     @commands.hybrid_command(name="testwelcome", description="Test welcome message (Admin only)")
-    @commands.has_permissions(administrator=True)
+    @is_admin_cached()
     async def test_welcome(self, ctx):
         """
         Test the welcome message system (Admin only)
@@ -130,50 +278,56 @@ class ConfigCog(commands.Cog):
         """
         try:
             # Get guild configuration for welcome channel
-            config = await get_guild_config(self.bot.guild_configs, str(ctx.guild.id))
+            config = await get_guild_config(self.bot.guild_configs, str(ctx.guild.id), ("welcome_channel_id",))
             welcome_channel_id = config.get('welcome_channel_id') if config else None
             
             if not welcome_channel_id:
                 await ctx.send("❌ Welcome channel not configured! Set it with `/config welcome #channel`", ephemeral=True)
                 return
             
-            welcome_channel = self.bot.get_channel(int(welcome_channel_id))
-            if not welcome_channel:
-                await ctx.send("❌ Welcome channel not found! It might have been deleted.", ephemeral=True)
-                return
+            # Fall back to a partial channel when it isn't cached; a deleted
+            # channel then shows up as NotFound when sending
+            welcome_channel = self.bot.get_channel(welcome_channel_id) or self.bot.get_partial_messageable(welcome_channel_id)
             
             # ============================================================================
             # WELCOME MESSAGE CREATION SECTION
             # ============================================================================
             
             # Get rotating welcome message (next in sequence)
-            welcome_message = self.welcome_messages[self.current_welcome_index]
-            self.current_welcome_index = (self.current_welcome_index + 1) % len(self.welcome_messages)
+            welcome_message = next(self._welcome_cycle)
             
-            # Create welcome embed with member information
-            embed = discord.Embed(
-                title=f"🌟 Welcome {ctx.author.display_name}! (TEST)",
-                description="We're delighted to have you join our wonderful community! Your presence here is truly valued and we're excited to have you as part of our server family.",
-                color=discord.Color.gold(),
-                timestamp=ctx.message.created_at
-            )
+            # Create welcome embed with member information from the shared template
+            embed = self._welcome_template.copy()
+            embed.title = f"🌟 Welcome {ctx.author.display_name}! (TEST)"
+            embed.timestamp = ctx.message.created_at
+            
+            # Resolve the guild assets once (each property access builds a new Asset)
+            guild = ctx.guild
+            guild_icon = guild.icon
+            guild_banner = guild.banner
             
             # Set thumbnail to member's avatar
-            embed.set_thumbnail(url=ctx.author.avatar.url if ctx.author.avatar else ctx.author.default_avatar.url)
+            embed.set_thumbnail(url=ctx.author.display_avatar.url)
             
             # Set footer with server information
             embed.set_footer(
-                text=f"Welcome to {ctx.guild.name} • We're glad you're here! ✨ (TEST)",
-                icon_url=ctx.guild.icon.url if ctx.guild.icon else None
+                text=f"Welcome to {guild.name} • We're glad you're here! ✨ (TEST)",
+                icon_url=guild_icon.url if guild_icon else None
             )
             
             # Add server banner if available
-            if ctx.guild.banner:
-                embed.set_image(url=ctx.guild.banner.url)
+            if guild_banner:
+                embed.set_image(url=guild_banner.url)
             
-            # Send test welcome message
-            await welcome_channel.send(embed=embed)
-            await ctx.send(f"✅ Test welcome message sent to {welcome_channel.mention}!", ephemeral=True)
+            # Send test welcome message (embed only, so nothing needs resolving as a mention)
+            try:
+                await welcome_channel.send(embed=embed, allowed_mentions=discord.AllowedMentions.none())
+            except discord.NotFound:
+                await ctx.send("❌ Welcome channel not found! It might have been deleted.", ephemeral=True)
+                return
+            
+            # Confirm only once the post has actually gone through
+            await ctx.send(f"✅ Test welcome message sent to <#{welcome_channel.id}>!", ephemeral=True)
             
         except Exception as e:
             await ctx.send(f"❌ Error: {str(e)}", ephemeral=True)
@@ -184,7 +338,7 @@ class ConfigCog(commands.Cog):
     # ============================================================================
     
     @commands.hybrid_command(name="botintro", description="Bot introduces itself and explains its features (Admin only)")
-    @commands.has_permissions(administrator=True)
+    @is_admin_cached()
     async def introduce_bot(self, ctx):
         """
         Bot introduces itself and explains its features (Admin only)
@@ -198,79 +352,49 @@ class ConfigCog(commands.Cog):
         The message is designed to be engaging and informative for server members.
         """
         try:
-            # Add detailed debug log to track command calls
-            logger.info(f"=== BOTINTRO COMMAND CALLED ===")
-            logger.info(f"Author: {ctx.author}")
-            logger.info(f"Guild: {ctx.guild}")
-            logger.info(f"Channel: {ctx.channel}")
-            logger.info(f"Message: {ctx.message.content}")
-            logger.info(f"Command type: {type(ctx).__name__}")
-            logger.info(f"Interaction: {ctx.interaction if hasattr(ctx, 'interaction') else 'None'}")
+            # Debug log to track command calls (%-style, formatted only if DEBUG is enabled)
+            logger.debug("botintro called by %s in %s (#%s)", ctx.author, ctx.guild, ctx.channel)
             
             # Get guild configuration for announcement channel
-            config = await get_guild_config(self.bot.guild_configs, str(ctx.guild.id))
+            config = await get_guild_config(self.bot.guild_configs, str(ctx.guild.id), ("announcement_channel_id",))
             announcement_channel_id = config.get('announcement_channel_id') if config else None
             
             if not announcement_channel_id:
                 await ctx.send("❌ Announcement channel not configured! Set it with `/config announcement #channel`", ephemeral=True)
                 return
             
-            announcement_channel = self.bot.get_channel(int(announcement_channel_id))
-            if not announcement_channel:
-                await ctx.send("❌ Announcement channel not found! It might have been deleted.", ephemeral=True)
-                return
+            # Fall back to a partial channel when it isn't cached; a deleted
+            # channel then shows up as NotFound when sending
+            announcement_channel = self.bot.get_channel(announcement_channel_id) or self.bot.get_partial_messageable(announcement_channel_id)
             
             # ============================================================================
             # BOT INTRODUCTION EMBED CREATION SECTION
             # ============================================================================
             
-            # Create casual and friendly bot introduction
-            embed = discord.Embed(
-                title="🤖 Server Manager Bot",
-                description="Hi everyone! 👋 I'm here to help manage this server and make it awesome! Here's what I can do:",
-                color=discord.Color.purple(),
-                timestamp=ctx.message.created_at
-            )
-            
-            # Birthday celebrations feature
-            embed.add_field(
-                name="🎂 Birthday Celebrations",
-                value="• Automatic celebrations at midnight\n• Custom birthday messages\n• Beautiful announcements with avatars",
-                inline=True
-            )
-            
-            # Daily events feature
-            embed.add_field(
-                name="📅 Daily Events",
-                value="• Morning updates at 8 AM\n• Holiday reminders\n• Special observances",
-                inline=True
-            )
-            
-            # Welcome system feature
-            embed.add_field(
-                name="🌟 Welcome System",
-                value="• Warm welcomes for new members\n• Beautiful welcome cards\n• Rotating welcome messages",
-                inline=True
-            )
-            
-            # Management tools feature
-            embed.add_field(
-                name="⚙️ Easy Management",
-                value="• Simple `/config` commands\n• Web dashboard for configuration\n• Admin testing tools",
-                inline=True
-            )
+            # Create casual and friendly bot introduction from the static embed data
+            # (title, description and feature fields are already in place)
+            embed = discord.Embed.from_dict({**_BOTINTRO_EMBED, "fields": [dict(f) for f in _BOTINTRO_EMBED["fields"]]})
+            embed.timestamp = ctx.message.created_at
             
             # Set footer with casual tone and bot information
-            embed.set_footer(
-                text=f"🤖 {self.bot.user.name} • Your friendly server assistant! Feel free to ask for help anytime! ✨",
-                icon_url=self.bot.user.avatar.url if self.bot.user.avatar else self.bot.user.default_avatar.url
-            )
+            # (bot.user doesn't change after login, so the footer is built once)
+            if self._botintro_footer_text is None:
+                bot_user = self.bot.user
+                self._botintro_footer_text = f"🤖 {bot_user.name} • Your friendly server assistant! Feel free to ask for help anytime! ✨"
+                self._botintro_footer_icon = bot_user.display_avatar.url
+            embed.set_footer(text=self._botintro_footer_text, icon_url=self._botintro_footer_icon)
+            
+            # Send the bot introduction (embed only, so nothing needs resolving as a mention)
+            try:
+                await announcement_channel.send(embed=embed, allowed_mentions=discord.AllowedMentions.none())
+            except discord.NotFound:
+                await ctx.send("❌ Announcement channel not found! It might have been deleted.", ephemeral=True)
+                return
             
-            # Send the bot introduction
-            await announcement_channel.send(embed=embed)
-            await ctx.send(f"✅ Bot introduction sent to {announcement_channel.mention}!", ephemeral=True)
+            # Confirm only once the post has actually gone through
+            await ctx.send(f"✅ Bot introduction sent to <#{announcement_channel.id}>!", ephemeral=True)
             
-            logger.info(f"=== BOTINTRO COMMAND COMPLETED SUCCESSFULLY ===")
+            logger.debug("botintro completed in %s", ctx.guild)
             
         except Exception as e:
             await ctx.send(f"❌ Error: {str(e)}", ephemeral=True)
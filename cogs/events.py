@@ -18,14 +18,185 @@ about special days and celebrations.
 import discord
 from discord.ext import commands
 import aiohttp
+import asyncio
+import orjson
 import logging
+import random
+import re
+import socket
+import sys
+import time
+from aiohttp.resolver import AsyncResolver
 from datetime import datetime
+from types import MappingProxyType
 from utils.timezone import IST
-from utils.database import get_guild_config
+from utils.database import get_guild_config, get_all_announcement_channels, update_guild_config
 import os
 
 logger = logging.getLogger(__name__)
 
+# aiodns lets aiohttp resolve the API hosts on the event loop instead of in
+# a thread pool; it is optional and not used on Windows
+try:
+    import aiodns  # noqa: F401
+    _USE_ASYNC_RESOLVER = sys.platform != "win32"
+except ImportError:
+    _USE_ASYNC_RESOLVER = False
+
+# Overall timeout in seconds for fetching today's event from the APIs
+EVENTS_API_TIMEOUT = int(os.getenv("EVENTS_API_TIMEOUT", "10"))
+
+# Per-request timeouts: an unreachable API fails its connect after 2s (and
+# can be retried) instead of using up the whole EVENTS_API_TIMEOUT budget
+_API_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=EVENTS_API_TIMEOUT, connect=2, sock_connect=2, sock_read=5)
+
+# Largest API response body read, in bytes; larger responses are skipped
+EVENTS_API_MAX_BYTES = 256 * 1024
+
+# Whether dates in KNOWN_HOLIDAYS skip the APIs entirely ("0" forces live fetches)
+EVENTS_PREFER_KNOWN = os.getenv("EVENTS_PREFER_KNOWN", "1") == "1"
+
+# Retries per API after a connection error or timeout, with exponential
+# backoff (0.5s, 1s, ...) plus jitter between attempts
+EVENTS_API_RETRIES = int(os.getenv("EVENTS_API_RETRIES", "2"))
+
+# Priority list for most popular/important events
+# These events are preferred when multiple events are available
+_PRIORITY_EVENTS = frozenset({
+    "friendship day", "sisters day", "national friendship day", "national sisters day",
+    "mother's day", "father's day", "valentine's day", "christmas", "new year",
+    "independence day", "thanksgiving", "halloween", "easter", "memorial day",
+    "veterans day", "labor day", "martin luther king day", "presidents day",
+    "national pizza day", "national ice cream day", "national chocolate day",
+    "international women's day", "international men's day", "earth day",
+    "national coffee day", "national donut day", "national burger day"
+})
+# One compiled alternation matches an event name against every priority phrase
+# in a single case-insensitive scan (same result as checking each phrase as a
+# substring of the lowercased name)
+_PRIORITY_PATTERN = re.compile(
+    "|".join(re.escape(p) for p in sorted(_PRIORITY_EVENTS, key=len, reverse=True)),
+    re.IGNORECASE
+)
+
+# Per-API extractors returning (name, url, description) from a raw event,
+# reading only the keys that provider uses
+_EXTRACTORS = {
+    "checkiday": lambda ev: (ev.get("name"), ev.get("url"), ev.get("description")),
+    "nationaltoday": lambda ev: (ev.get("title"), ev.get("link"), ev.get("excerpt")),
+    "abstractapi": lambda ev: (ev.get("name"), ev.get("website"), ev.get("description")),
+}
+
+def _extract_any(ev):
+    """Extract (name, url, description) from an event of unknown format"""
+    return (
+        ev.get('name') or ev.get('title') or ev.get('holiday') or ev.get('summary'),
+        ev.get('url') or ev.get('link') or ev.get('website'),
+        ev.get('description') or ev.get('excerpt') or ev.get('summary')
+    )
+
+def _normalize_event(event):
+    """Return an event's (name, description, url) with display defaults applied"""
+    return (
+        event.get('name') or 'Special Day',
+        event.get('description') or 'Today is a special day worth celebrating!',
+        event.get('url')
+    )
+
+# Maximum number of daily event announcements sent at the same time, keeping
+# the concurrent guild fan-out under Discord's global rate limit
+EVENTS_SEND_CONCURRENCY = int(os.getenv("EVENTS_SEND_CONCURRENCY", "40"))
+
+# Maximum daily event announcements started per second across all guilds.
+# Each guild posts to its own channel, so the per-channel message limit is
+# never reached; this only keeps the 8 AM burst under Discord's global limit
+# of 50 requests per second instead of running into its 429 backoff
+EVENTS_SEND_RATE = float(os.getenv("EVENTS_SEND_RATE", "45"))
+if EVENTS_SEND_RATE <= 0:
+    logger.warning(f"EVENTS_SEND_RATE must be positive (got {EVENTS_SEND_RATE}), using 45")
+    EVENTS_SEND_RATE = 45.0
+
+# Guild count from which daily announcements are posted through a per-channel
+# webhook (created on first use and stored in the guild config), so the
+# fan-out isn't limited by the bot's own send rate limits
+EVENTS_WEBHOOK_MIN_GUILDS = int(os.getenv("EVENTS_WEBHOOK_MIN_GUILDS", "100"))
+_EVENTS_WEBHOOK_NAME = "StationManager Events"
+
+# Mention settings for the daily announcement; guilds opt in to the
+# @everyone ping with the mention_everyone config field
+_MENTION_EVERYONE = discord.AllowedMentions(everyone=True, users=False, roles=False)
+_MENTION_NONE = discord.AllowedMentions.none()
+
+# Guild config fields needed to find the events channel
+_EVENTS_CONFIG_FIELDS = ("events_channel_id", "announcement_channel_id")
+
+class _TokenBucket:
+    """
+    Async token-bucket rate limiter
+    
+    Allows up to `rate` acquisitions per second, with bursts of up to `rate`
+    (at least one, so rates below 1 still admit a send every 1/rate seconds).
+    Use as `async with bucket:` - entering waits until a token is available.
+    """
+    
+    def __init__(self, rate):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self._rate = rate
+        self._capacity = max(1.0, rate)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def __aenter__(self):
+        # The lock keeps waiters in arrival order while one of them sleeps
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+    
+    async def __aexit__(self, *exc_info):
+        return False
+
+# ============================================================================
+# KNOWN HOLIDAYS FALLBACK SECTION
+# ============================================================================
+
+# Known holidays with descriptions (in case APIs fail)
+# This provides reliable fallback events for specific dates.
+# Built once at import and wrapped read-only, since the same event objects
+# are handed to every caller.
+KNOWN_HOLIDAYS = MappingProxyType({
+    date: tuple(MappingProxyType(event) for event in events)
+    for date, events in {
+        "08/03": [
+            {"name": "Friendship Day", "url": "https://www.checkiday.com/7aa7b1b24d0504b7cff363562be9cc47/friendship-day", "description": "A day to celebrate the beautiful bonds of friendship that enrich our lives. Take time to reach out to friends, old and new, and let them know how much they mean to you."},
+            {"name": "Sisters' Day", "url": "https://www.checkiday.com/ea4f14ed66abb6a04b8ee0a1eb1843c8/sisters-day", "description": "Honor the special relationship between sisters everywhere. Whether biological or chosen, sisters share a unique bond that lasts a lifetime."},
+            {"name": "National Watermelon Day", "url": "https://www.checkiday.com/6b0d36b1c8fe376fe20d8f0c83fb1500/national-watermelon-day", "description": "Celebrate this refreshing summer fruit that's perfect for hot days. Watermelon is not only delicious but also packed with hydration and nutrients."}
+        ],
+        "08/04": [
+            {"name": "National Chocolate Chip Cookie Day", "url": "https://nationaltoday.com/national-chocolate-chip-cookie-day/", "description": "Celebrate the classic American cookie that brings joy to people of all ages. Bake some cookies and share them with loved ones!"},
+            {"name": "National Coast Guard Day", "url": "https://nationaltoday.com/national-coast-guard-day/", "description": "Honor the brave men and women of the Coast Guard who protect our waters and save lives every day."}
+        ],
+        "08/05": [
+            {"name": "National Oyster Day", "url": "https://nationaltoday.com/national-oyster-day/", "description": "Celebrate this delicious seafood delicacy that's enjoyed around the world. Oysters are not only tasty but also rich in nutrients."},
+            {"name": "National Work Like a Dog Day", "url": "https://nationaltoday.com/national-work-like-a-dog-day/", "description": "Work hard and stay dedicated to your goals. This day reminds us of the importance of perseverance and determination."}
+        ]
+    }.items()
+})
+
+# Final fallback event when no API works and the date has no known holiday
+FALLBACK_EVENT = MappingProxyType({
+    "name": "Mac Never Told Me What's Special Today",
+    "url": "",
+    "description": "🤖 Mac didn't tell me what's special today, but that doesn't mean today isn't special! Every day is what you make of it. Take a moment to appreciate the little things and make today amazing!"
+})
+
 class EventsCog(commands.Cog):
     """
     Events management cog that handles daily events and holiday announcements
@@ -46,13 +217,90 @@ class EventsCog(commands.Cog):
             bot: The Discord bot instance
         """
         self.bot = bot
+        self._http = None  # Shared HTTP session, created in cog_load
+        self._event_cache = None  # (date, events) for the last day fetched
+        self._send_semaphore = asyncio.Semaphore(EVENTS_SEND_CONCURRENCY)
+        self._send_limiter = _TokenBucket(EVENTS_SEND_RATE)
+        self._channel_cache = {}  # channel_id -> resolved events channel
         logger.info("Events cog initialized")
     
+    async def cog_load(self):
+        """
+        Create the HTTP session used for the event APIs
+        
+        One session is kept for the lifetime of the cog so connections and
+        DNS lookups are pooled across API requests and daily runs. When aiodns
+        is installed, lookups use the c-ares resolver over IPv4.
+        """
+        resolver_options = {}
+        if _USE_ASYNC_RESOLVER:
+            resolver_options = {"resolver": AsyncResolver(), "family": socket.AF_INET}
+        self._http = aiohttp.ClientSession(
+            headers={"User-Agent": "ServerManagerBot/1.0"},
+            timeout=_API_REQUEST_TIMEOUT,
+            connector=aiohttp.TCPConnector(limit=16, ttl_dns_cache=3600, keepalive_timeout=60, **resolver_options)
+        )
+    
+    async def cog_unload(self):
+        """Close the HTTP session when the cog is unloaded"""
+        if self._http:
+            await self._http.close()
+    
     @commands.Cog.listener()
     async def on_ready(self):
-        """Called when the cog is ready and loaded"""
+        """
+        Called when the cog is ready and loaded
+        
+        on_ready also fires after every reconnect that re-identifies, when
+        discord.py rebuilds its channel objects; cached channels are dropped
+        so they are resolved again (and channels deleted while disconnected
+        are forgotten).
+        """
+        self._channel_cache.clear()
         logger.info("Events cog ready")
     
+    # ============================================================================
+    # CHANNEL CACHE SECTION
+    # ============================================================================
+    
+    def _get_events_channel(self, channel_id):
+        """
+        Resolve an events channel, remembering it for later daily runs
+        
+        bot.get_channel() searches every guild the bot is in, so resolved
+        channels are kept in a dict that on_ready and the channel listeners
+        below keep up to date.
+        
+        Args:
+            channel_id: The channel ID to resolve
+            
+        Returns:
+            The channel, or None if the bot can't see it
+        """
+        channel = self._channel_cache.get(channel_id)
+        if channel is None:
+            channel = self.bot.get_channel(channel_id)
+            if channel is not None:
+                self._channel_cache[channel_id] = channel
+        return channel
+    
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        """Forget a deleted channel"""
+        self._channel_cache.pop(channel.id, None)
+    
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before, after):
+        """Keep the cached channel object current"""
+        if after.id in self._channel_cache:
+            self._channel_cache[after.id] = after
+    
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild):
+        """Forget the channels of a guild the bot has left"""
+        for channel in guild.channels:
+            self._channel_cache.pop(channel.id, None)
+    
     # ============================================================================
     # EVENT FETCHING SECTION
     # ============================================================================
@@ -62,11 +310,12 @@ class EventsCog(commands.Cog):
         Fetch daily events from multiple APIs for reliability
         
         This method:
-        1. Tries multiple event APIs in sequence
+        1. Uses the known holiday for the date, otherwise queries multiple
+           event APIs concurrently and uses the first answer
         2. Prioritizes popular and important events
         3. Provides fallback events when APIs fail
         4. Handles different API response formats
-        5. Returns the best event for the day
+        5. Returns the best event for the day (cached until the date changes)
         
         The method uses a priority system to select the most relevant
         event when multiple events are available for the same day.
@@ -77,150 +326,241 @@ class EventsCog(commands.Cog):
         try:
             # Get today's date in IST timezone
             today = datetime.now(IST)
-            date_str = today.strftime("%m/%d")  # Format: MM/DD
-            logger.info(f"Fetching events for date: {date_str}")
             
-            # ============================================================================
-            # PRIORITY EVENTS SECTION
-            # ============================================================================
+            # Today's event is the same for every guild and test, so it is
+            # fetched once per day and served from memory afterwards
+            if self._event_cache and self._event_cache[0] == today.date():
+                return self._event_cache[1]
             
-            # Priority list for most popular/important events
-            # These events are preferred when multiple events are available
-            priority_events = [
-                "friendship day", "sisters day", "national friendship day", "national sisters day",
-                "mother's day", "father's day", "valentine's day", "christmas", "new year",
-                "independence day", "thanksgiving", "halloween", "easter", "memorial day",
-                "veterans day", "labor day", "martin luther king day", "presidents day",
-                "national pizza day", "national ice cream day", "national chocolate day",
-                "international women's day", "international men's day", "earth day",
-                "national coffee day", "national donut day", "national burger day"
-            ]
-            
-            # ============================================================================
-            # KNOWN HOLIDAYS FALLBACK SECTION
-            # ============================================================================
+            date_str = today.strftime("%m/%d")  # Format: MM/DD
+            logger.info("Fetching events for date: %s", date_str)
             
-            # Known holidays with descriptions (in case APIs fail)
-            # This provides reliable fallback events for specific dates
-            known_holidays = {
-                "08/03": [
-                    {"name": "Friendship Day", "url": "https://www.checkiday.com/7aa7b1b24d0504b7cff363562be9cc47/friendship-day", "description": "A day to celebrate the beautiful bonds of friendship that enrich our lives. Take time to reach out to friends, old and new, and let them know how much they mean to you."},
-                    {"name": "Sisters' Day", "url": "https://www.checkiday.com/ea4f14ed66abb6a04b8ee0a1eb1843c8/sisters-day", "description": "Honor the special relationship between sisters everywhere. Whether biological or chosen, sisters share a unique bond that lasts a lifetime."},
-                    {"name": "National Watermelon Day", "url": "https://www.checkiday.com/6b0d36b1c8fe376fe20d8f0c83fb1500/national-watermelon-day", "description": "Celebrate this refreshing summer fruit that's perfect for hot days. Watermelon is not only delicious but also packed with hydration and nutrients."}
-                ],
-                "08/04": [
-                    {"name": "National Chocolate Chip Cookie Day", "url": "https://nationaltoday.com/national-chocolate-chip-cookie-day/", "description": "Celebrate the classic American cookie that brings joy to people of all ages. Bake some cookies and share them with loved ones!"},
-                    {"name": "National Coast Guard Day", "url": "https://nationaltoday.com/national-coast-guard-day/", "description": "Honor the brave men and women of the Coast Guard who protect our waters and save lives every day."}
-                ],
-                "08/05": [
-                    {"name": "National Oyster Day", "url": "https://nationaltoday.com/national-oyster-day/", "description": "Celebrate this delicious seafood delicacy that's enjoyed around the world. Oysters are not only tasty but also rich in nutrients."},
-                    {"name": "National Work Like a Dog Day", "url": "https://nationaltoday.com/national-work-like-a-dog-day/", "description": "Work hard and stay dedicated to your goals. This day reminds us of the importance of perseverance and determination."}
-                ]
-            }
+            # Known holidays already have a curated answer, so no API is needed
+            if EVENTS_PREFER_KNOWN and date_str in KNOWN_HOLIDAYS:
+                logger.info("Using known holidays for %s", date_str)
+                self._event_cache = (today.date(), [KNOWN_HOLIDAYS[date_str][0]])
+                return [KNOWN_HOLIDAYS[date_str][0]]
             
             # ============================================================================
             # API FETCHING SECTION
             # ============================================================================
             
-            # Try multiple APIs for better reliability
-            # If one API fails, we try the next one
+            # Use multiple APIs for better reliability
+            # If one API fails, another can still provide today's event
             apis = [
                 (f"https://www.checkiday.com/api/3/?d={date_str}", "checkiday"),
                 (f"https://nationaltoday.com/wp-json/nationaltoday/v1/date/{today.month}/{today.day}", "nationaltoday"),
                 (f"https://holidays.abstractapi.com/v1/?api_key=demo&country=US&year={today.year}&month={today.month}&day={today.day}", "abstractapi"),
             ]
             
-            request_timeout_seconds = int(os.getenv("EVENTS_API_TIMEOUT", "10"))
-
-            for api_url, source in apis:
-                try:
-                    logger.info(f"Trying API: {api_url}")
-                    
-                    # Create HTTP session and fetch data
-                    async with aiohttp.ClientSession(headers={"User-Agent": "ServerManagerBot/1.0"}) as session:
-                        async with session.get(api_url, timeout=request_timeout_seconds) as response:
-                            if response.status == 200:
-                                data = await response.json()
-                                logger.info(f"API response received")
-                                
-                                # ============================================================================
-                                # RESPONSE PARSING SECTION
-                                # ============================================================================
-                                
-                                # Handle different API formats and normalize
-                                raw_events = []
-                                if isinstance(data, dict) and 'events' in data:
-                                    raw_events = data['events']
-                                elif isinstance(data, dict) and 'holidays' in data:
-                                    raw_events = data['holidays']
-                                elif isinstance(data, list):
-                                    raw_events = data
-
-                                events = []
-                                for ev in raw_events:
-                                    name = ev.get('name') or ev.get('title') or ev.get('holiday') or ev.get('summary')
-                                    url = ev.get('url') or ev.get('link') or ev.get('website')
-                                    description = ev.get('description') or ev.get('excerpt') or ev.get('summary')
-                                    if name:
-                                        events.append({'name': name, 'url': url, 'description': description, '_src': source})
-                                
-                                if events:
-                                    # Find the most popular/important event
-                                    best_event = None
-                                    
-                                    # First, look for priority events
-                                    for event in events:
-                                        event_name = (event.get('name') or '').lower()
-                                        if any(priority in event_name for priority in priority_events):
-                                            best_event = event
-                                            logger.info(f"Found priority event: {event.get('name')}")
-                                            break
-                                    
-                                    # If no priority event found, take the first one
-                                    if not best_event and events:
-                                        best_event = events[0]
-                                        logger.info(f"Using first event: {best_event.get('name')}")
-                                    
-                                    if best_event:
-                                        # Add description if not present
-                                        if not best_event.get('description'):
-                                            best_event['description'] = f"Today we celebrate {best_event.get('name')}! This special day reminds us of the importance of this occasion in our lives."
-                                        
-                                        return [best_event]  # Return only the best event
-                                    
-                                else:
-                                    logger.warning(f"No events found in API response")
-                            else:
-                                logger.warning(f"API returned status {response.status}")
-                                
-                except Exception as e:
-                    logger.error(f"Error with API {api_url}: {str(e)}")
-                    continue  # Try next API
-                
+            # Query all APIs at once and take the first one that returns an event,
+            # so a slow or failing API no longer delays the others
+            tasks = [
+                asyncio.create_task(self._fetch_one(api_url, source))
+                for api_url, source in apis
+            ]
+            try:
+                for next_result in asyncio.as_completed(tasks, timeout=EVENTS_API_TIMEOUT):
+                    try:
+                        best_event = await next_result
+                    except asyncio.TimeoutError:
+                        logger.warning("Event APIs did not respond within %ss", EVENTS_API_TIMEOUT)
+                        break
+                    if best_event:
+                        self._event_cache = (today.date(), [best_event])
+                        return [best_event]  # Return only the best event
+            finally:
+                # Stop the APIs that are still running once we have a result
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+            
             # ============================================================================
             # FALLBACK SECTION
             # ============================================================================
             
             # Check known holidays fallback
-            if date_str in known_holidays:
-                logger.info(f"Using known holidays for {date_str}")
-                return [known_holidays[date_str][0]]  # Return only the first (most important) event
+            if date_str in KNOWN_HOLIDAYS:
+                logger.info("Using known holidays for %s", date_str)
+                self._event_cache = (today.date(), [KNOWN_HOLIDAYS[date_str][0]])
+                return [KNOWN_HOLIDAYS[date_str][0]]  # Return only the first (most important) event
             
             # Final fallback: Create a basic event for today
+            # (not cached, so a later call can still pick up a real event)
             logger.info("No API working and no known holidays, creating fallback event")
-            fallback_events = [
-                {
-                    "name": "Mac Never Told Me What's Special Today",
-                    "url": "",
-                    "description": "🤖 Mac didn't tell me what's special today, but that doesn't mean today isn't special! Every day is what you make of it. Take a moment to appreciate the little things and make today amazing!"
-                }
-            ]
-            return fallback_events
+            return [FALLBACK_EVENT]
                 
         except Exception as e:
-            logger.error(f"Error fetching daily events: {str(e)}")
+            logger.error("Error fetching daily events: %s", e)
             return []
     
+    async def _fetch_one(self, api_url, source):
+        """
+        Fetch events from a single API and pick its best event
+        
+        This method:
+        1. Requests the API (retrying transient failures) and parses its JSON response
+        2. Normalizes the different API formats into name/url/description
+        3. Prefers a priority event, otherwise takes the first event
+        
+        Args:
+            api_url: The API URL to request
+            source: Short name of the API (stored on the event as '_src')
+            
+        Returns:
+            dict: The best event from this API, or None if it had none or failed
+        """
+        try:
+            logger.info("Trying API: %s", api_url)
+            
+            # Retries share one EVENTS_API_TIMEOUT budget per API
+            data = await asyncio.wait_for(self._get_json(api_url), timeout=EVENTS_API_TIMEOUT)
+            if data is None:
+                return None
+            
+            # ============================================================================
+            # RESPONSE PARSING SECTION
+            # ============================================================================
+            
+            # Handle different API formats and normalize
+            raw_events = []
+            if isinstance(data, dict) and 'events' in data:
+                raw_events = data['events']
+            elif isinstance(data, dict) and 'holidays' in data:
+                raw_events = data['holidays']
+            elif isinstance(data, list):
+                raw_events = data
+
+            extract = _EXTRACTORS.get(source, _extract_any)
+            events = []
+            for ev in raw_events:
+                name, url, description = extract(ev)
+                if name:
+                    events.append({'name': name, 'url': url, 'description': description, '_src': source})
+            
+            if not events:
+                logger.warning("No events found in API response")
+                return None
+            
+            # Find the most popular/important event
+            best_event = None
+            
+            # First, look for priority events
+            for event in events:
+                if _PRIORITY_PATTERN.search(event['name']):
+                    best_event = event
+                    logger.info("Found priority event: %s", event['name'])
+                    break
+            
+            # If no priority event found, take the first one
+            if not best_event:
+                best_event = events[0]
+                logger.info("Using first event: %s", best_event.get('name'))
+            
+            # Add description if not present
+            if not best_event.get('description'):
+                best_event['description'] = f"Today we celebrate {best_event.get('name')}! This special day reminds us of the importance of this occasion in our lives."
+            
+            return best_event
+            
+        except Exception as e:
+            logger.error("Error with API %s: %s", api_url, e)
+            return None
+    
+    async def _get_json(self, api_url):
+        """
+        Request an API and decode its JSON body, retrying transient failures
+        
+        Connection errors and timeouts are retried up to EVENTS_API_RETRIES
+        times with exponential backoff and jitter, so a brief network blip
+        doesn't skip the API. Other errors are raised immediately.
+        
+        Args:
+            api_url: The API URL to request
+            
+        Returns:
+            The decoded JSON data, or None if the API returned a non-200 status
+            or a body that isn't valid JSON
+        """
+        for attempt in range(EVENTS_API_RETRIES + 1):
+            try:
+                async with self._http.get(api_url) as response:
+                    if response.status != 200:
+                        logger.warning("API returned status %s", response.status)
+                        return None
+                    # Read at most EVENTS_API_MAX_BYTES so an oversized response
+                    # can't exhaust memory, then parse the raw bytes with orjson
+                    if response.content_length and response.content_length > EVENTS_API_MAX_BYTES:
+                        logger.warning("API response is %s bytes, over the %s byte limit: %s", response.content_length, EVENTS_API_MAX_BYTES, api_url)
+                        return None
+                    # StreamReader.read(n) returns whatever is buffered, so keep
+                    # reading until the body ends or the limit is reached
+                    raw = bytearray()
+                    while len(raw) < EVENTS_API_MAX_BYTES and not response.content.at_eof():
+                        raw += await response.content.read(EVENTS_API_MAX_BYTES - len(raw))
+                    if not response.content.at_eof():
+                        logger.warning("API response exceeds the %s byte limit: %s", EVENTS_API_MAX_BYTES, api_url)
+                        return None
+                    try:
+                        data = orjson.loads(raw)
+                    except orjson.JSONDecodeError as e:
+                        logger.warning("API returned invalid JSON (%s): %s", response.content_type, e)
+                        return None
+                    logger.info("API response received")
+                    return data
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt == EVENTS_API_RETRIES:
+                    raise
+                delay = 0.5 * 2 ** attempt
+                delay += random.uniform(0, delay)
+                logger.warning("API request failed (%s), retrying in %.1fs: %s", type(e).__name__, delay, api_url)
+                await asyncio.sleep(delay)
+    
+    # ============================================================================
+    # EMBED CREATION SECTION
+    # ============================================================================
+    
+    def _build_event_embed(self, event, test=False):
+        """
+        Build the announcement embed for an event
+        
+        Shared by the daily announcement and the test command so both
+        always show the same content.
+        
+        Args:
+            event: The event dictionary to announce
+            test: Whether to mark the embed as a test announcement
+            
+        Returns:
+            discord.Embed: The announcement embed
+        """
+        now = datetime.now(IST)
+        name, description, url = _normalize_event(event)
+        
+        # Create single event announcement embed
+        embed = discord.Embed(
+            title="📅 What's Special Today? (TEST)" if test else "📅 What's Special Today?",
+            description=f"**{name}**\n\n{description}",
+            color=discord.Color.blue(),
+            timestamp=now
+        )
+        
+        # Add clickable link if available
+        if url:
+            embed.add_field(
+                name="🔗 Learn More",
+                value=f"[Click here to read more about {name}]({url})",
+                inline=False
+            )
+        
+        # Set embed styling with bot thumbnail (and test indicator)
+        footer = f"📅 {now.strftime('%B %d, %Y')} • Daily Events"
+        if test:
+            footer += " • (TEST)"
+        embed.set_footer(text=footer)
+        embed.set_thumbnail(url=self.bot.user.avatar.url if self.bot.user.avatar else self.bot.user.default_avatar.url)
+        return embed
+    
     # ============================================================================
     # EVENT ANNOUNCEMENT SECTION
     # ============================================================================
@@ -231,10 +571,11 @@ class EventsCog(commands.Cog):
         
         This method:
         1. Fetches today's events using the fetch_daily_events method
-        2. Sends announcements to all guilds with configured announcement channels
-        3. Creates rich embeds with event information
-        4. Handles errors gracefully for individual guilds
-        5. Logs successful announcements
+        2. Sends announcements only to guilds with configured announcement channels
+        3. Creates one rich embed with the event information
+        4. Sends to all guilds concurrently, handling errors per guild
+        5. Uses per-channel webhooks once the bot is in EVENTS_WEBHOOK_MIN_GUILDS guilds
+        6. Logs successful announcements
         
         This method is called automatically by the background task in bot.py
         every day at 8 AM.
@@ -247,59 +588,145 @@ class EventsCog(commands.Cog):
                 logger.info("No events found for today")
                 return
             
-            # Get the single best event
-            event = events[0]
-            
-            # Send announcement to all guilds the bot is in
-            for guild in self.bot.guilds:
-                try:
-                    # Get guild configuration for events settings
-                    config = await get_guild_config(self.bot.guild_configs, str(guild.id))
-                    # Try events_channel_id first, fallback to announcement_channel_id for backward compatibility
-                    events_channel_id = config.get('events_channel_id') if config else None
-                    if not events_channel_id:
-                        events_channel_id = config.get('announcement_channel_id') if config else None
-                    
-                    if not events_channel_id:
-                        continue  # Skip guilds without events channel
-                    
-                    events_channel = self.bot.get_channel(int(events_channel_id))
-                    if not events_channel:
-                        continue  # Skip if channel not found
-                    
-                    # ============================================================================
-                    # EMBED CREATION SECTION
-                    # ============================================================================
-                    
-                    # Create single event announcement embed
-                    embed = discord.Embed(
-                        title="📅 What's Special Today?",
-                        description=f"**{event.get('name', 'Special Day')}**\n\n{event.get('description', 'Today is a special day worth celebrating!')}",
-                        color=discord.Color.blue(),
-                        timestamp=datetime.now(IST)
-                    )
-                    
-                    # Add clickable link if available
-                    if event.get('url'):
-                        embed.add_field(
-                            name="🔗 Learn More",
-                            value=f"[Click here to read more about {event.get('name')}]({event.get('url')})",
-                            inline=False
-                        )
-                    
-                    # Set embed styling with bot thumbnail
-                    embed.set_footer(text=f"📅 {datetime.now(IST).strftime('%B %d, %Y')} • Daily Events")
-                    embed.set_thumbnail(url=self.bot.user.avatar.url if self.bot.user.avatar else self.bot.user.default_avatar.url)
-                    
-                    # Send announcement
-                    await events_channel.send(embed=embed)
-                    logger.info(f"Sent daily events announcement to {guild.name}")
-                    
-                except Exception as e:
-                    logger.error(f"Error sending events announcement to guild {guild.id}: {str(e)}")
+            # The announcement is identical for every guild, so the embed for
+            # the single best event is built once and sent to each channel
+            embed = self._build_event_embed(events[0])
+            
+            # Look up every guild's events channel in a single query
+            channels = await get_all_announcement_channels(self.bot.guild_configs)
+            
+            # Large deployments post through webhooks instead of the bot's send route
+            use_webhooks = len(self.bot.guilds) >= EVENTS_WEBHOOK_MIN_GUILDS
+            
+            # Send announcement to every configured guild, concurrently
+            # (only guilds with an events channel are visited, not every guild the bot is in)
+            results = await asyncio.gather(
+                *(self._send_to_guild(guild_id, channel_id, embed, mention_everyone,
+                                      webhook_url if use_webhooks else False)
+                  for guild_id, (channel_id, mention_everyone, webhook_url) in channels.items()),
+                return_exceptions=True
+            )
+            for guild_id, result in zip(channels, results):
+                if isinstance(result, Exception):
+                    logger.error("Error sending events announcement to guild %s: %s", guild_id, result)
                     
         except Exception as e:
-            logger.error(f"Error in daily events announcement: {str(e)}")
+            logger.error("Error in daily events announcement: %s", e)
+    
+    async def _send_to_guild(self, guild_id, events_channel_id, embed, mention_everyone=False, webhook_url=False):
+        """
+        Send the daily event announcement to a single guild
+        
+        Channels the bot can no longer see (deleted, or a guild it has left)
+        are skipped.
+        
+        Args:
+            guild_id: The guild ID (string), used to store a created webhook
+            events_channel_id: The guild's configured events channel ID
+            embed: The prepared announcement embed (shared by all guilds)
+            mention_everyone: Whether the guild opted in to an @everyone ping
+            webhook_url: The stored events webhook URL, None to create one,
+                or False to send as the bot
+        """
+        events_channel = self._get_events_channel(events_channel_id)
+        if not events_channel:
+            return  # Skip if channel not found
+        
+        send_options = {
+            "content": "@everyone" if mention_everyone else None,
+            "embed": embed,
+            "allowed_mentions": _MENTION_EVERYONE if mention_everyone else _MENTION_NONE
+        }
+        
+        # Send announcement (limited by the send semaphore, and by the send
+        # rate when posting as the bot)
+        async with self._send_semaphore:
+            if webhook_url is not False and await self._send_via_webhook(guild_id, events_channel, webhook_url, send_options):
+                logger.info("Sent daily events announcement to %s via webhook", events_channel.guild.name)
+                return
+            async with self._send_limiter:
+                await events_channel.send(**send_options)
+        logger.info("Sent daily events announcement to %s", events_channel.guild.name)
+    
+    async def _send_via_webhook(self, guild_id, channel, webhook_url, send_options):
+        """
+        Post the daily event announcement through the channel's events webhook
+        
+        This method:
+        1. Reuses the stored webhook, or creates one in the channel and stores it
+        2. Posts the announcement with the bot's name and avatar
+        3. Forgets a stored webhook that has been deleted
+        
+        Args:
+            guild_id: The guild ID (string) whose config stores the webhook
+            channel: The events channel
+            webhook_url: The stored webhook URL, or None to create a webhook
+            send_options: Keyword arguments for the send call
+            
+        Returns:
+            bool: True if sent, False if the caller should send as the bot
+        """
+        if webhook_url:
+            webhook = discord.Webhook.from_url(webhook_url, client=self.bot)
+        else:
+            webhook = await self._create_events_webhook(guild_id, channel)
+            if webhook is None:
+                return False
+        
+        try:
+            await webhook.send(
+                username=self.bot.user.name,
+                avatar_url=self.bot.user.display_avatar.url,
+                **send_options
+            )
+            return True
+        except discord.NotFound:
+            # The webhook was deleted; a new one is created on the next run
+            logger.warning("Events webhook for guild %s no longer exists", guild_id)
+            await update_guild_config(self.bot.guild_configs, guild_id, {"events_webhook_url": ""})
+        except discord.HTTPException as e:
+            logger.warning("Could not send through the events webhook in guild %s: %s", guild_id, e)
+        return False
+    
+    async def _create_events_webhook(self, guild_id, channel):
+        """
+        Create the events webhook for a channel and store it in the guild config
+        
+        When the bot isn't allowed to manage webhooks, the channel is marked
+        as unavailable so later runs send as the bot without trying again
+        (setting a new events channel clears the mark). A webhook whose URL
+        can't be stored is deleted again, so failed runs don't leave extra
+        webhooks behind in the channel.
+        
+        Args:
+            guild_id: The guild ID (string) whose config stores the webhook
+            channel: The events channel
+            
+        Returns:
+            discord.Webhook: The new webhook, or None if it couldn't be set up
+        """
+        try:
+            webhook = await channel.create_webhook(name=_EVENTS_WEBHOOK_NAME)
+        except discord.Forbidden as e:
+            logger.warning("Missing permission to create an events webhook in guild %s: %s", guild_id, e)
+            await update_guild_config(self.bot.guild_configs, guild_id, {"events_webhook_unavailable_channel_id": channel.id})
+            return None
+        except discord.HTTPException as e:
+            logger.warning("Could not create an events webhook in guild %s: %s", guild_id, e)
+            return None
+        
+        stored = await update_guild_config(self.bot.guild_configs, guild_id, {
+            "events_webhook_url": webhook.url,
+            "events_webhook_channel_id": channel.id
+        })
+        if not stored:
+            logger.warning("Could not store the events webhook for guild %s, removing it", guild_id)
+            try:
+                await webhook.delete()
+            except discord.HTTPException as e:
+                logger.warning("Could not remove the unstored events webhook in guild %s: %s", guild_id, e)
+            return None
+        return webhook
     
     # ============================================================================
     # TESTING COMMANDS SECTION
@@ -307,7 +734,7 @@ class EventsCog(commands.Cog):
     
     @commands.hybrid_command(name="testevents", description="Test daily events announcement (Admin only)")
     @commands.has_permissions(administrator=True)
-    async def test_events(self, ctx):
+    async def test_events(self, ctx, force_refresh: bool = False):
         """
         Test the daily events announcement (Admin only)
         
@@ -317,7 +744,13 @@ class EventsCog(commands.Cog):
         3. Event fetching and formatting works as expected
         
         The test uses the same logic as the automatic daily announcement
-        but sends it immediately instead of waiting for 8 AM.
+        but sends it immediately instead of waiting for 8 AM. It shows the
+        cached event for today (the one the 8 AM announcement sent) unless
+        force_refresh is set.
+        
+        Args:
+            ctx: Discord context
+            force_refresh: Discard today's cached event and fetch it again
         """
         try:
             # ============================================================================
@@ -325,7 +758,7 @@ class EventsCog(commands.Cog):
             # ============================================================================
             
             # First check if events channel is configured
-            config = await get_guild_config(self.bot.guild_configs, str(ctx.guild.id))
+            config = await get_guild_config(self.bot.guild_configs, str(ctx.guild.id), _EVENTS_CONFIG_FIELDS)
             # Try events_channel_id first, fallback to announcement_channel_id for backward compatibility
             events_channel_id = config.get('events_channel_id') if config else None
             if not events_channel_id:
@@ -335,7 +768,7 @@ class EventsCog(commands.Cog):
                 await ctx.send("❌ Events channel not configured! Set it with `/config events #channel`", ephemeral=True)
                 return
             
-            events_channel = self.bot.get_channel(int(events_channel_id))
+            events_channel = self.bot.get_channel(events_channel_id)
             if not events_channel:
                 await ctx.send("❌ Events channel not found! It might have been deleted.", ephemeral=True)
                 return
@@ -346,43 +779,23 @@ class EventsCog(commands.Cog):
             # EVENT FETCHING AND SENDING SECTION
             # ============================================================================
             
-            # Fetch and send events
+            # Fetch and send events (served from today's cache unless refreshing)
+            if force_refresh:
+                self._event_cache = None
             events = await self.fetch_daily_events()
             
             if not events:
                 await ctx.send("❌ No events found for today.", ephemeral=True)
                 return
             
-            # Get the single best event
-            event = events[0]
-            
-            # Create single event announcement embed (test version)
-            embed = discord.Embed(
-                title="📅 What's Special Today? (TEST)",
-                description=f"**{event.get('name', 'Special Day')}**\n\n{event.get('description', 'Today is a special day worth celebrating!')}",
-                color=discord.Color.blue(),
-                timestamp=datetime.now(IST)
-            )
-            
-            # Add clickable link if available
-            if event.get('url'):
-                embed.add_field(
-                    name="🔗 Learn More",
-                    value=f"[Click here to read more about {event.get('name')}]({event.get('url')})",
-                    inline=False
-                )
-            
-            # Set embed styling with test indicator and bot thumbnail
-            embed.set_footer(text=f"📅 {datetime.now(IST).strftime('%B %d, %Y')} • Daily Events • (TEST)")
-            embed.set_thumbnail(url=self.bot.user.avatar.url if self.bot.user.avatar else self.bot.user.default_avatar.url)
-            
-            # Send test announcement
-            await events_channel.send(embed=embed)
+            # Send the same embed as the daily announcement for the best event,
+            # marked as a test
+            await events_channel.send(embed=self._build_event_embed(events[0], test=True))
             await ctx.send(f"✅ Daily events test announcement sent to {events_channel.mention}!", ephemeral=True)
             
         except Exception as e:
             await ctx.send(f"❌ Error: {str(e)}", ephemeral=True)
-            logger.error(f"Error testing events: {str(e)}")
+            logger.error("Error testing events: %s", e)
 
 # ============================================================================
 # COG SETUP SECTION
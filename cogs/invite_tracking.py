@@ -15,12 +15,21 @@ understand their server growth and member acquisition patterns.
 
 import discord
 from discord.ext import commands
+import heapq
 import logging
-from datetime import datetime
-from utils.timezone import IST
+from utils.database import get_guild_config
 
 logger = logging.getLogger(__name__)
 
+# Embed colors, created once instead of on every embed
+_COLOR_WELCOME = discord.Color.gold()
+_COLOR_INVITES = discord.Color.blue()
+_COLOR_STATS = discord.Color.green()
+
+# Config fields read by the join/leave listeners; both use the same tuple so
+# they share one cached config read per guild
+_MEMBER_EVENT_CONFIG_FIELDS = ("log_channel_id", "welcome_channel_id")
+
 class InviteTrackingCog(commands.Cog):
     """
     Invite tracking cog that handles member join/leave events and invite statistics
@@ -69,6 +78,7 @@ class InviteTrackingCog(commands.Cog):
         """
         try:
             guild = member.guild
+            guild_id = guild.id
             invite_used = None
             inviter = None
             
@@ -82,9 +92,11 @@ class InviteTrackingCog(commands.Cog):
                 current_invites = await guild.invites()
                 
                 # Compare with cached invites to find which one was used
-                if guild.id in self.bot.invite_cache:
+                # (single pass over current invites, O(1) lookup by code)
+                cached_invites = self.bot.invite_cache.get(guild_id)
+                if cached_invites is not None:
                     for invite in current_invites:
-                        cached_invite = self.bot.invite_cache[guild.id].get(invite.code)
+                        cached_invite = cached_invites.get(invite.code)
                         if cached_invite and invite.uses > cached_invite.uses:
                             # This invite was used (usage count increased)
                             invite_used = invite
@@ -92,7 +104,7 @@ class InviteTrackingCog(commands.Cog):
                             break
                 
                 # Update invite cache with current invites
-                self.bot.invite_cache[guild.id] = {invite.code: invite for invite in current_invites}
+                self.bot.invite_cache[guild_id] = {invite.code: invite for invite in current_invites}
                 
             except Exception as e:
                 logger.warning(f"Could not track invite for {member.display_name}: {str(e)}")
@@ -101,12 +113,12 @@ class InviteTrackingCog(commands.Cog):
             # LOG CHANNEL SECTION
             # ============================================================================
             
-            # Get log channel from guild configuration
-            config = await self.bot.guild_configs.find_one({"guild_id": str(guild.id)})
+            # Get log channel from guild configuration (cached between joins)
+            config = await get_guild_config(self.bot.guild_configs, str(guild_id), _MEMBER_EVENT_CONFIG_FIELDS)
             log_channel_id = config.get('log_channel_id') if config else None
             
             if log_channel_id:
-                log_channel = self.bot.get_channel(int(log_channel_id))
+                log_channel = self.bot.get_channel(log_channel_id)
                 if log_channel:
                     # Create log message with mentions
                     if inviter:
@@ -124,31 +136,39 @@ class InviteTrackingCog(commands.Cog):
             # Get welcome channel from guild configuration
             welcome_channel_id = config.get('welcome_channel_id') if config else None
             if welcome_channel_id:
-                welcome_channel = self.bot.get_channel(int(welcome_channel_id))
+                welcome_channel = self.bot.get_channel(welcome_channel_id)
                 if welcome_channel:
                     # Create welcome embed with member information
                     embed = discord.Embed(
                         title="🌟 Welcome!",
                         description=f"{member.mention}, we're delighted to have you join our wonderful community! Your presence here is truly valued and we're excited to have you as part of our server family.",
-                        color=discord.Color.gold(),
-                        timestamp=datetime.now(IST)
+                        color=_COLOR_WELCOME,
+                        timestamp=discord.utils.utcnow()
                     )
                     
+                    # Resolve the guild assets once (each property access builds a new Asset)
+                    guild_icon = guild.icon
+                    guild_banner = guild.banner
+                    
                     # Set member's avatar as thumbnail
-                    embed.set_thumbnail(url=member.avatar.url if member.avatar else member.default_avatar.url)
+                    embed.set_thumbnail(url=member.display_avatar.url)
                     
                     # Set footer with server information
                     embed.set_footer(
                         text=f"Welcome to {guild.name} • We're glad you're here! ✨",
-                        icon_url=guild.icon.url if guild.icon else None
+                        icon_url=guild_icon.url if guild_icon else None
                     )
                     
                     # Add server banner if available
-                    if guild.banner:
-                        embed.set_image(url=guild.banner.url)
+                    if guild_banner:
+                        embed.set_image(url=guild_banner.url)
                     
                     # Send welcome message with @everyone mention
-                    await welcome_channel.send(content="@everyone", embed=embed)
+                    await welcome_channel.send(
+                        content="@everyone",
+                        embed=embed,
+                        allowed_mentions=discord.AllowedMentions(everyone=True, users=False, roles=False)
+                    )
                     logger.info(f'👋 Sent welcome message for {member.display_name} in {guild.name}')
                     
         except Exception as e:
@@ -173,13 +193,14 @@ class InviteTrackingCog(commands.Cog):
         """
         try:
             guild = member.guild
+            guild_id = guild.id
             
-            # Get log channel from guild configuration
-            config = await self.bot.guild_configs.find_one({"guild_id": str(guild.id)})
+            # Get log channel from guild configuration (cached between leaves)
+            config = await get_guild_config(self.bot.guild_configs, str(guild_id), _MEMBER_EVENT_CONFIG_FIELDS)
             log_channel_id = config.get('log_channel_id') if config else None
             
             if log_channel_id:
-                log_channel = self.bot.get_channel(int(log_channel_id))
+                log_channel = self.bot.get_channel(log_channel_id)
                 if log_channel:
                     # Create simple leave log message
                     msg = f"{member.mention} left"
@@ -268,15 +289,15 @@ class InviteTrackingCog(commands.Cog):
             embed = discord.Embed(
                 title="🎫 Server Invites",
                 description=f"Active invites for **{guild.name}**",
-                color=discord.Color.blue(),
-                timestamp=datetime.now(IST)
+                color=_COLOR_INVITES,
+                timestamp=discord.utils.utcnow()
             )
             
-            # Sort invites by uses (most used first)
-            sorted_invites = sorted(invites, key=lambda x: x.uses, reverse=True)
+            # Pick the 10 most used invites (no need to sort the whole list)
+            top_invites = heapq.nlargest(10, invites, key=lambda x: x.uses)
             
             # Add top 10 invites to embed
-            for i, invite in enumerate(sorted_invites[:10]):
+            for i, invite in enumerate(top_invites):
                 inviter_name = invite.inviter.display_name if invite.inviter else "Unknown"
                 max_uses = invite.max_uses if invite.max_uses else "∞"
                 uses_text = f"{invite.uses}/{max_uses}"
@@ -288,10 +309,10 @@ class InviteTrackingCog(commands.Cog):
                 )
             
             # Set footer with summary information
-            if len(sorted_invites) > 10:
-                embed.set_footer(text=f"Showing top 10 of {len(sorted_invites)} invites")
+            if len(invites) > 10:
+                embed.set_footer(text=f"Showing top 10 of {len(invites)} invites")
             else:
-                embed.set_footer(text=f"Total: {len(sorted_invites)} invites")
+                embed.set_footer(text=f"Total: {len(invites)} invites")
             
             await ctx.send(embed=embed, ephemeral=True)
             
@@ -327,21 +348,20 @@ class InviteTrackingCog(commands.Cog):
             # STATISTICS CALCULATION SECTION
             # ============================================================================
             
-            # Calculate overall statistics
-            total_uses = sum(invite.uses for invite in invites)
+            # Calculate overall statistics and group them by inviter in one pass
+            total_uses = 0
             total_invites = len(invites)
-            
-            # Group statistics by inviter
             inviter_stats = {}
             for invite in invites:
+                uses = invite.uses
+                total_uses += uses
                 inviter_name = invite.inviter.display_name if invite.inviter else "Unknown"
-                if inviter_name not in inviter_stats:
-                    inviter_stats[inviter_name] = {"invites": 0, "uses": 0}
-                inviter_stats[inviter_name]["invites"] += 1
-                inviter_stats[inviter_name]["uses"] += invite.uses
+                stats = inviter_stats.setdefault(inviter_name, {"invites": 0, "uses": 0})
+                stats["invites"] += 1
+                stats["uses"] += uses
             
-            # Sort inviters by total uses (most effective first)
-            sorted_inviters = sorted(inviter_stats.items(), key=lambda x: x[1]["uses"], reverse=True)
+            # Pick the top 5 inviters by total uses (most effective first)
+            top_inviters = heapq.nlargest(5, inviter_stats.items(), key=lambda x: x[1]["uses"])
             
             # ============================================================================
             # EMBED CREATION SECTION
@@ -351,8 +371,8 @@ class InviteTrackingCog(commands.Cog):
             embed = discord.Embed(
                 title="📊 Invite Statistics",
                 description=f"Detailed invite statistics for **{guild.name}**",
-                color=discord.Color.green(),
-                timestamp=datetime.now(IST)
+                color=_COLOR_STATS,
+                timestamp=discord.utils.utcnow()
             )
             
             # Add overall statistics
@@ -363,7 +383,7 @@ class InviteTrackingCog(commands.Cog):
             )
             
             # Add top 5 inviters with detailed statistics
-            for i, (inviter_name, stats) in enumerate(sorted_inviters[:5]):
+            for i, (inviter_name, stats) in enumerate(top_inviters):
                 embed.add_field(
                     name=f"#{i+1} {inviter_name}",
                     value=f"**Invites:** {stats['invites']}\n**Total Uses:** {stats['uses']}\n**Avg Uses/Invite:** {stats['uses']/stats['invites']:.1f}",
@@ -371,10 +391,10 @@ class InviteTrackingCog(commands.Cog):
                 )
             
             # Set footer with summary information
-            if len(sorted_inviters) > 5:
-                embed.set_footer(text=f"Showing top 5 of {len(sorted_inviters)} inviters")
+            if len(inviter_stats) > 5:
+                embed.set_footer(text=f"Showing top 5 of {len(inviter_stats)} inviters")
             else:
-                embed.set_footer(text=f"Total: {len(sorted_inviters)} inviters")
+                embed.set_footer(text=f"Total: {len(inviter_stats)} inviters")
             
             await ctx.send(embed=embed, ephemeral=True)
             
@@ -13,7 +13,7 @@ This cog provides:
 import discord
 from discord.ext import commands
 import logging
-from utils.database import get_guild_config
+from utils.database import get_guild_config, invalidate_guild_config
 
 logger = logging.getLogger(__name__)
 
@@ -43,7 +43,7 @@ class RoleCog(commands.Cog):
         """
         try:
             # Get guild configuration from database
-            config = await get_guild_config(self.bot.guild_configs, str(member.guild.id))
+            config = await get_guild_config(self.bot.guild_configs, str(member.guild.id), ("default_role_id",))
             
             if not config or 'default_role_id' not in config or not config['default_role_id']:
                 logger.debug(f"No default role configured for {member.guild.name}")
@@ -84,6 +84,7 @@ class RoleCog(commands.Cog):
                 {"$set": {"default_role_id": str(role.id)}},
                 upsert=True
             )
+            invalidate_guild_config(ctx.guild.id)
             
             # Create success embed
             embed = discord.Embed(
@@ -124,7 +125,7 @@ class RoleCog(commands.Cog):
         """
         try:
             # Get guild configuration
-            config = await get_guild_config(self.bot.guild_configs, str(ctx.guild.id))
+            config = await get_guild_config(self.bot.guild_configs, str(ctx.guild.id), ("default_role_id",))
             
             if not config or 'default_role_id' not in config or not config['default_role_id']:
                 embed = discord.Embed(
@@ -253,7 +254,7 @@ class RoleCog(commands.Cog):
         Show the currently configured default role (Admin only)
         """
         try:
-            config = await get_guild_config(self.bot.guild_configs, str(ctx.guild.id))
+            config = await get_guild_config(self.bot.guild_configs, str(ctx.guild.id), ("default_role_id",))
             
             if not config or 'default_role_id' not in config or not config['default_role_id']:
                 embed = discord.Embed(
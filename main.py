@@ -15,6 +15,9 @@ The bot runs both a Discord bot and a web interface simultaneously.
 
 import os
 import logging
+import logging.handlers
+import queue
+import atexit
 import asyncio
 import time
 import discord
@@ -34,10 +37,23 @@ load_dotenv()
 
 # Configure logging for the entire application
 # This sets up how log messages are formatted and displayed
+# The real output handler runs on a QueueListener thread; the application only
+# enqueues records, so logging from the event loop never blocks on I/O
+_log_handler = logging.StreamHandler()  # Output logs to console
+_log_handler.setFormatter(logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'  # Format: timestamp - module - level - message
+))
+_log_queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # Drain queued records before the process exits
+
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))  # Final formatting happens on the listener
+
 logging.basicConfig(
     level=logging.INFO,  # Log level: INFO shows important messages, DEBUG shows everything
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Format: timestamp - module - level - message
-    handlers=[logging.StreamHandler()]  # Output logs to console
+    handlers=[_queue_handler]
 )
 
 # Create a logger for this specific module
@@ -11,38 +11,98 @@ The module is designed to work with MongoDB collections and provides
 a consistent interface for database operations across the bot.
 """
 
+import os
 import logging
+import time
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 
 logger = logging.getLogger(__name__)
 
+# ============================================================================
+# GUILD CONFIG CACHE SECTION
+# ============================================================================
+
+# Guild configs change rarely but are read on every member join/leave.
+# A short-lived in-process copy lets hot event handlers skip the MongoDB
+# round-trip; every write path drops the entry via invalidate_guild_config().
+GUILD_CONFIG_CACHE_TTL = float(os.getenv("GUILD_CONFIG_CACHE_TTL", "30"))  # Seconds before a cached config is re-read
+_guild_config_cache = {}     # guild_id -> {fields: (fetched_at, config)}
+
+def invalidate_guild_config(guild_id):
+    """
+    Drop the cached configuration for a guild
+    
+    Call this after writing to the guild_configs collection so the next
+    get_guild_config() call reads the updated document.
+    
+    Args:
+        guild_id: The Discord guild ID (string or int)
+    """
+    _guild_config_cache.pop(str(guild_id), None)
+
+def _coerce_channel_ids(doc):
+    """
+    Convert string channel IDs in a config document to ints, in place
+    
+    Channel IDs are stored as integers so readers can pass them straight to
+    bot.get_channel(). Configs written before that stored them as strings,
+    and the web dashboard submits them as form strings, so both the read and
+    write paths run documents through this helper.
+    
+    Args:
+        doc: Guild config document or update dictionary
+        
+    Returns:
+        dict: The same dictionary, for chaining
+    """
+    for key, value in doc.items():
+        if key.endswith("_channel_id") and isinstance(value, str) and value.isdigit():
+            doc[key] = int(value)
+    return doc
+
 # ============================================================================
 # DATABASE UTILITY FUNCTIONS SECTION
 # ============================================================================
 
-async def get_guild_config(guild_configs_collection, guild_id: str):
+async def get_guild_config(guild_configs_collection, guild_id: str, fields=None):
     """
     Retrieve guild configuration from the database
     
     This function fetches the configuration settings for a specific guild
     from the MongoDB collection. It's used throughout the bot to get
     channel configurations, welcome messages, and other guild-specific settings.
+    Results are cached for GUILD_CONFIG_CACHE_TTL seconds.
     
     Args:
         guild_configs_collection: MongoDB collection containing guild configs
         guild_id: The Discord guild ID as a string
+        fields: Optional tuple of field names to fetch; when given, only those
+            fields are read from MongoDB instead of the whole document
         
     Returns:
         dict: Guild configuration dictionary, or None if not found
         
     Example:
-        config = await get_guild_config(bot.guild_configs, "123456789")
+        config = await get_guild_config(bot.guild_configs, "123456789", ("welcome_channel_id",))
         if config:
             welcome_channel = config.get('welcome_channel_id')
     """
+    # Serve from the in-process cache while the entry is fresh
+    # (full and projected reads are cached separately per guild)
+    guild_cache = _guild_config_cache.get(guild_id)
+    cached = guild_cache.get(fields) if guild_cache else None
+    if cached and time.monotonic() - cached[0] < GUILD_CONFIG_CACHE_TTL:
+        return cached[1]
+    
     try:
         # Query the database for the guild configuration
         # The guild_id is stored as a string in the database for consistency
-        config = await guild_configs_collection.find_one({"guild_id": guild_id})
+        projection = {"_id": 0, **{field: 1 for field in fields}} if fields else None
+        config = await guild_configs_collection.find_one({"guild_id": guild_id}, projection)
+        if config:
+            _coerce_channel_ids(config)
+        _guild_config_cache.setdefault(guild_id, {})[fields] = (time.monotonic(), config)
         
         if config:
             logger.debug(f"Retrieved config for guild {guild_id}")
@@ -56,22 +116,119 @@ async def get_guild_config(guild_configs_collection, guild_id: str):
         logger.error(f"Error retrieving config for guild {guild_id}: {str(e)}")
         return None
 
+async def get_all_announcement_channels(guild_configs_collection) -> dict:
+    """
+    Retrieve the events channel of every configured guild in one query
+    
+    Used by the daily events announcement so the per-guild fan-out needs no
+    config lookups of its own. The events channel is preferred, falling back
+    to the announcement channel for backward compatibility.
+    
+    Args:
+        guild_configs_collection: MongoDB collection containing guild configs
+        
+    Returns:
+        dict: Mapping of guild ID (string) to a (channel ID, mention_everyone,
+            webhook URL) tuple; empty on error. The webhook URL is the stored
+            events webhook for that channel, None if there is none yet, or
+            False if a webhook can't be created in that channel
+    """
+    try:
+        cursor = guild_configs_collection.find(
+            {"$or": [
+                {"events_channel_id": {"$nin": [None, ""]}},
+                {"announcement_channel_id": {"$nin": [None, ""]}}
+            ]},
+            {"_id": 0, "guild_id": 1, "events_channel_id": 1, "announcement_channel_id": 1,
+             "mention_everyone": 1, "events_webhook_url": 1, "events_webhook_channel_id": 1,
+             "events_webhook_unavailable_channel_id": 1}
+        )
+        channels = {}
+        async for config in cursor:
+            _coerce_channel_ids(config)
+            channel_id = config.get("events_channel_id") or config.get("announcement_channel_id")
+            if channel_id:
+                # Webhook state stored for a previous events channel is ignored
+                webhook_url = None
+                if config.get("events_webhook_unavailable_channel_id") == channel_id:
+                    webhook_url = False
+                elif config.get("events_webhook_channel_id") == channel_id:
+                    webhook_url = config.get("events_webhook_url") or None
+                channels[config["guild_id"]] = (channel_id, bool(config.get("mention_everyone", False)), webhook_url)
+        
+        logger.debug(f"Retrieved announcement channels for {len(channels)} guilds")
+        return channels
+        
+    except Exception as e:
+        # Log database errors but don't crash the bot
+        logger.error(f"Error retrieving announcement channels: {str(e)}")
+        return {}
+
+async def create_default_guild_config(collection, guild) -> bool:
+    """
+    Create the default configuration document for a guild
+    
+    Called when the bot joins a guild (and for guilds found without a config
+    at startup) so that later configuration writes can update an existing
+    document instead of upserting.
+    
+    Args:
+        collection: MongoDB collection containing guild configs
+        guild: The Discord guild
+        
+    Returns:
+        bool: True if a config was created, False if one already existed
+    """
+    try:
+        await collection.insert_one({
+            "guild_id": str(guild.id),
+            "guild_name": guild.name,
+            "welcome_channel_id": None,
+            "announcement_channel_id": None,
+            "birthday_message": "🎉 **Happy Birthday {USER_MENTION}!** 🎉\nHope you have an amazing day!"
+        })
+    except DuplicateKeyError:
+        return False
+    finally:
+        invalidate_guild_config(guild.id)
+    return True
+
 async def update_guild_config(collection, guild_id: str, updates: dict) -> bool:
     """Update guild configuration"""
     try:
         # Filter out None values
-        filtered_updates = {k: v for k, v in updates.items() if v is not None}
+        filtered_updates = _coerce_channel_ids({k: v for k, v in updates.items() if v is not None})
         
         if not filtered_updates:
             return True
         
-        result = await collection.update_one(
+        # Configs are created when the bot joins a guild, so a plain update
+        # normally matches; only fall back to inserting when it doesn't.
+        # The updated document comes back in the same round-trip.
+        config = await collection.find_one_and_update(
             {"guild_id": guild_id},
             {"$set": filtered_updates},
-            upsert=True
+            return_document=ReturnDocument.AFTER
         )
+        if config is None:
+            try:
+                config = {"guild_id": guild_id, **filtered_updates}
+                await collection.insert_one(config)
+            except DuplicateKeyError:
+                # Created concurrently since the update ran - update it now
+                config = await collection.find_one_and_update(
+                    {"guild_id": guild_id},
+                    {"$set": filtered_updates},
+                    return_document=ReturnDocument.AFTER
+                )
+        
+        # Replace any cached reads with the document just written, so the
+        # next full get_guild_config() call needs no database round-trip
+        invalidate_guild_config(guild_id)
+        if config:
+            _guild_config_cache[guild_id] = {None: (time.monotonic(), _coerce_channel_ids(config))}
         
-        return result.acknowledged
+        return True
     except Exception as e:
         error_msg = str(e)
         if "Cannot use MongoClient after close" in error_msg:
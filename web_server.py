@@ -21,7 +21,7 @@ from flask import Flask, render_template, request, redirect, url_for, flash, jso
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from flask_wtf.csrf import CSRFProtect
-from utils.database import get_guild_config, update_guild_config
+from utils.database import get_guild_config, update_guild_config, invalidate_guild_config
 from datetime import datetime, timedelta
 from utils.timezone import IST
 
@@ -263,7 +263,7 @@ def create_app(bot):
             try:
                 guild = bot.get_guild(int(guild_id))
                 if guild:
-                    channels = [{"id": str(c.id), "name": c.name} for c in guild.text_channels]
+                    channels = [{"id": c.id, "name": c.name} for c in guild.text_channels]
             except (ValueError, AttributeError) as e:
                 logger.error(f"Error getting guild info: {str(e)}")
         
@@ -421,7 +421,8 @@ def create_app(bot):
         """
         try:
             # Get guild configuration from database
-            config = bot.guild_configs.find_one({"guild_id": str(guild_id)})
+            # (the events webhook URL contains its token, so it is never returned)
+            config = bot.guild_configs.find_one({"guild_id": str(guild_id)}, {"events_webhook_url": 0})
             
             if config:
                 # Convert ObjectId to string for JSON serialization
@@ -461,6 +462,7 @@ def create_app(bot):
                 {"$set": data},
                 upsert=True
             )
+            invalidate_guild_config(guild_id)
             
             if result.modified_count > 0 or result.upserted_id:
                 return jsonify({'success': True, 'message': 'Configuration updated'})
@@ -614,6 +616,7 @@ def create_app(bot):
                 )
             
             result = run_async(update_message())
+            invalidate_guild_config(guild_id)
             
             return jsonify({
                 "success": True,